@@ -5,10 +5,21 @@ AI引擎 - 管理各种AI风格的决策逻辑
 import random
 from typing import Dict, Tuple, List, Any
 from texas_holdem.core.player import Player
+from texas_holdem.core.evaluator import PokerEvaluator
 from texas_holdem.game.betting import BettingRound
-from texas_holdem.utils.constants import GameState
+from texas_holdem.utils.constants import Action, GameState
 
 
+# 行动名 -> Action（Action 常量本身就是小写行动名）
+_ACTION_BY_NAME = {
+    'fold': Action.FOLD,
+    'check': Action.CHECK,
+    'call': Action.CALL,
+    'bet': Action.BET,
+    'raise': Action.RAISE,
+    'all_in': Action.ALL_IN
+}
+
 class AIEngine:
     """AI决策引擎"""
     
@@ -66,14 +77,12 @@ class AIEngine:
         Returns:
             (action, amount) 元组
         """
-        from texas_holdem.utils.constants import Action
-        
         game_state = betting_round.game_state
         available_actions = betting_round.get_available_actions(player)
         amount_to_call = betting_round.get_amount_to_call(player)
         current_bet = game_state.current_bet
         
-        style = getattr(player, 'ai_style', 'LAG')
+        style = player.ai_style or 'LAG'
         
         # 如果是鲨鱼，需要特殊处理
         if style == 'SHARK':
@@ -99,20 +108,17 @@ class AIEngine:
                        win_probability, pot_odds, ev):
         """鲨鱼AI决策（由SharkAI类处理）"""
         # 这里会被SharkAI类覆盖
-        from texas_holdem.utils.constants import Action
         return Action.FOLD, 0
     
     def _choose_action_by_style(self, player, available_actions, amount_to_call,
                                 current_bet, hand_strength, game_state, config,
                                 pot_odds, win_probability, ev, total_pot=100) -> Tuple[Any, int]:
         """根据风格选择行动"""
-        from texas_holdem.utils.constants import Action
-        
         is_preflop = (game_state == GameState.PRE_FLOP)
-        style = getattr(player, 'ai_style', 'LAG')
+        style = player.ai_style or 'LAG'
         
-        # 根据可用行动过滤（提前获取）
-        available_names = [str(a).lower().replace('action.', '') for a in available_actions]
+        # 根据可用行动过滤（Action 常量即行动名，直接使用）
+        available_names = available_actions
         
         # 翻牌前起手牌选择
         if is_preflop:
@@ -134,15 +140,7 @@ class AIEngine:
         action_name = self._weighted_choice(action_weights, available_names)
         
         # 映射到Action
-        action_map = {
-            'fold': Action.FOLD,
-            'check': Action.CHECK,
-            'call': Action.CALL,
-            'bet': Action.BET,
-            'raise': Action.RAISE,
-            'all_in': Action.ALL_IN
-        }
-        action = action_map.get(action_name, Action.FOLD)
+        action = _ACTION_BY_NAME.get(action_name, Action.FOLD)
         
         # 计算金额
         amount = self._calculate_amount(
@@ -286,21 +284,20 @@ class AIEngine:
     @staticmethod
     def evaluate_hand_strength(hole_cards, community_cards) -> float:
         """评估手牌强度（0.0-1.0）"""
-        from texas_holdem.core.evaluator import PokerEvaluator
-        
         if not hole_cards:
             return 0.5
         
-        all_cards = hole_cards + community_cards
-        
-        if len(all_cards) >= 5:
-            rank, values = PokerEvaluator.evaluate_hand(all_cards)
-            base_strength = rank / 9.0
-            
-            if values:
-                high_card_bonus = values[0] / 14.0 * 0.2
-                return min(1.0, base_strength + high_card_bonus)
-            return base_strength
+        if len(hole_cards) + len(community_cards) >= 5:
+            # 直接用位掩码评估：分值高位为牌型等级，其后4位为首个比较牌面值
+            card_mask = 0
+            for card in hole_cards:
+                card_mask |= card.encoded
+            for card in community_cards:
+                card_mask |= card.encoded
+            score = PokerEvaluator.evaluate_mask(card_mask)
+            base_strength = (score >> 20) / 9.0
+            high_card_bonus = ((score >> 16) & 0xF) / 14.0 * 0.2
+            return min(1.0, base_strength + high_card_bonus)
         else:
             return AIEngine._evaluate_preflop_strength(hole_cards)
     
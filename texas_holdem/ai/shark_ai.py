@@ -4,11 +4,128 @@
 """
 
 import random
-from typing import Dict, List, Tuple, Any, Optional
+from bisect import bisect_left
+from itertools import accumulate
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, Tuple, Any, Optional, Union
 from texas_holdem.core.player import Player
 from texas_holdem.game.betting import BettingRound
-from texas_holdem.utils.constants import GameState
+from texas_holdem.utils.constants import Action, GameState
 from texas_holdem.core.card import Card
+from texas_holdem.core.evaluator import PokerEvaluator
+
+
+# 10种顺子的13位牌面掩码（2 -> bit0, A -> bit12），最后一个是A-2-3-4-5轮子顺
+WHEEL_MASK = 0x100F
+BROADWAY_MASK = 0x1F00
+STRAIGHT_MASKS = tuple(0x1F << i for i in range(9)) + (WHEEL_MASK,)
+
+# 每个顺子图案中缺了只能卡顺的牌：一般是中间三张（缺两端的牌是两端顺）；
+# A-2-3-4-5 与 10-J-Q-K-A 只能向一端延伸（A-2-3-4 只听5，J-Q-K-A 只听10），缺哪张都算卡顺
+_STRAIGHT_INNER = tuple(
+    (m, m if m in (WHEEL_MASK, BROADWAY_MASK) else m & (m << 1) & (m >> 1))
+    for m in STRAIGHT_MASKS
+)
+
+# 听牌最多计算的outs数量（同花+两端顺+高张）
+MAX_OUTS = 21
+
+
+def _build_outs_equity_table() -> Dict[int, Tuple[float, ...]]:
+    """预计算听牌胜率表：公共牌张数 -> 按outs索引的完成概率
+    
+    剩余未知牌为 52 - 2 - 公共牌数，还要发 5 - 公共牌数 张，
+    胜率 = 1 - 后续每张都不中的概率
+    """
+    table = {}
+    for board_count in (3, 4, 5):
+        unseen = 52 - 2 - board_count
+        to_come = 5 - board_count
+        row = []
+        for outs in range(MAX_OUTS + 1):
+            miss = 1.0
+            for k in range(to_come):
+                miss *= (unseen - outs - k) / (unseen - k)
+            row.append(1.0 - miss)
+        table[board_count] = tuple(row)
+    return table
+
+
+_OUTS_EQUITY = _build_outs_equity_table()
+
+# 后门同花：翻牌圈起转牌、河牌都要中同花色 (10/47 * 9/46)
+_BACKDOOR_FLUSH_EQUITY = 10 / 47 * 9 / 46
+
+# 把13位牌面掩码复制到四个花色上，得到52位掩码
+_ALL_SUITS = 1 | 1 << 13 | 1 << 26 | 1 << 39
+# 底牌中有Q及以上的大牌时才考虑高牌Outs
+_HIGH_HOLE_MASK = 0x1C00 * _ALL_SUITS
+
+
+if hasattr(int, 'bit_count'):
+    # Python 3.10+：原生 popcount
+    _popcount = int.bit_count
+else:
+    def _popcount(x: int) -> int:
+        """统计整数中置位的个数"""
+        return bin(x).count('1')
+
+
+def _suit_ranks(card_mask: int, suit: int) -> int:
+    """从52位牌掩码中取出某个花色的13位牌面掩码"""
+    return (card_mask >> (suit * 13)) & 0x1FFF
+
+
+@lru_cache(maxsize=4096)
+def _identify_draws_mask(hole_mask: int, board_mask: int) -> Dict[str, Any]:
+    """根据底牌/公共牌的52位掩码识别听牌（结果按掩码缓存）"""
+    draws = {}
+    all_mask = hole_mask | board_mask
+    board_count = _popcount(board_mask)
+    equity = _OUTS_EQUITY[board_count]
+    
+    # 单次遍历四个花色：同花检测，同时累积总牌面掩码和公共牌牌面掩码
+    rank_mask = 0
+    board_ranks = 0
+    for s in range(4):
+        suited = _suit_ranks(all_mask, s)
+        rank_mask |= suited
+        board_ranks |= _suit_ranks(board_mask, s)
+        suited_count = _popcount(suited)
+        # 同花听牌检测：4张同花且至少1张来自底牌
+        if suited_count == 4 and _suit_ranks(hole_mask, s):
+            draws['flush_draw'] = {'outs': 9, 'equity': equity[9]}
+        # 检查后门同花
+        elif suited_count == 3 and board_count == 3:
+            draws['backdoor_flush'] = {'outs': 1, 'equity': _BACKDOOR_FLUSH_EQUITY}
+    
+    # 顺子听牌检测：某个顺子图案中恰好命中4张
+    for pattern, inner in _STRAIGHT_INNER:
+        if _popcount(rank_mask & pattern) != 4:
+            continue
+        if not (pattern & ~rank_mask & inner):
+            # 缺的是图案两端的牌：两端顺子听牌 (OESD)
+            draws['oesd'] = {'outs': 8, 'equity': equity[8]}
+        else:
+            # 缺的是中间的牌（或只能向一端延伸）：卡顺听牌 (Gutshot)
+            draws['gutshot'] = {'outs': 4, 'equity': equity[4]}
+    
+    # 检查高牌 Outs
+    if hole_mask & _HIGH_HOLE_MASK:  # Q、K或A
+        # 公共牌最大牌只算一次：比它大的牌面位复制到四个花色，与底牌求交计数
+        board_max_bit = board_ranks.bit_length()
+        overcard_outs = _popcount(hole_mask & ((0x1FFF >> board_max_bit << board_max_bit) * _ALL_SUITS))
+        if overcard_outs > 0:
+            draws['overcards'] = {'outs': overcard_outs * 3, 'equity': equity[overcard_outs * 3]}
+    
+    # 组合听牌
+    if 'flush_draw' in draws and 'oesd' in draws:
+        draws['combo_draw'] = {'outs': 15, 'equity': equity[15]}
+    elif 'flush_draw' in draws and 'gutshot' in draws:
+        draws['combo_draw'] = {'outs': 12, 'equity': equity[12]}
+    
+    return draws
 
 
 class DrawEvaluator:
@@ -16,59 +133,20 @@ class DrawEvaluator:
     
     @staticmethod
     def identify_draws(hole_cards: List[Card], community_cards: List[Card]) -> Dict[str, Any]:
-        """识别所有可能的听牌"""
-        draws = {}
-        if not community_cards:
-            return draws
-        
-        all_cards = hole_cards + community_cards
-        values = sorted(set([c.value for c in all_cards]))
-        suits = [c.suit for c in all_cards]
+        """识别所有可能的听牌
         
-        # 同花听牌检测
-        for suit in set(suits):
-            suited_cards = [c for c in all_cards if c.suit == suit]
-            if len(suited_cards) == 4:
-                # 检查是否是后门同花（只有2张同花色）
-                hole_suited = [c for c in hole_cards if c.suit == suit]
-                if len(hole_suited) >= 1:
-                    draws['flush_draw'] = {'outs': 9, 'equity': 0.35}
-        
-        # 检查后门同花
-        for suit in set(suits):
-            suited_count = suits.count(suit)
-            if suited_count == 3 and len(community_cards) == 3:
-                draws['backdoor_flush'] = {'outs': 1, 'equity': 0.04}
-        
-        # 顺子听牌检测
-        if len(values) >= 4:
-            # 检查两端顺子听牌 (OESD)
-            for i in range(len(values) - 3):
-                if values[i+3] - values[i] == 3 and len(set(values[i:i+4])) == 4:
-                    draws['oesd'] = {'outs': 8, 'equity': 0.31}
-                    break
-            
-            # 检查卡顺听牌 (Gutshot)
-            for i in range(len(values) - 3):
-                gap = values[i+3] - values[i]
-                if gap == 4 and len(set(values[i:i+4])) == 4:
-                    draws['gutshot'] = {'outs': 4, 'equity': 0.16}
-                    break
-        
-        # 检查高牌 Outs
-        hole_values = sorted([c.value for c in hole_cards], reverse=True)
-        if hole_values[0] >= 12:  # A或K
-            overcard_outs = sum(1 for v in hole_values if v > max(community_cards, key=lambda x: x.value).value)
-            if overcard_outs > 0:
-                draws['overcards'] = {'outs': overcard_outs * 3, 'equity': overcard_outs * 0.12}
-        
-        # 组合听牌
-        if 'flush_draw' in draws and 'oesd' in draws:
-            draws['combo_draw'] = {'outs': 15, 'equity': 0.54}
-        elif 'flush_draw' in draws and 'gutshot' in draws:
-            draws['combo_draw'] = {'outs': 12, 'equity': 0.45}
-        
-        return draws
+        返回的字典会被缓存复用，调用方不应修改
+        """
+        if not community_cards:
+            return {}
+        
+        hole_mask = 0
+        for c in hole_cards:
+            hole_mask |= c.encoded
+        board_mask = 0
+        for c in community_cards:
+            board_mask |= c.encoded
+        return _identify_draws_mask(hole_mask, board_mask)
     
     @staticmethod
     def calculate_total_equity(draws: Dict) -> float:
@@ -79,38 +157,135 @@ class DrawEvaluator:
         return max(d['equity'] for d in draws.values())
 
 
+class Position(IntEnum):
+    """桌上位置（按索引访问位置相关的表）"""
+    EP = 0
+    MP = 1
+    CO = 2
+    BTN = 3
+    SB = 4
+    BB = 5
+
+
 class PositionAwareness:
     """位置感知系统"""
     
-    # 位置价值乘数（影响入池阈值）
-    POSITION_MULTIPLIERS = {
-        'EP': 0.70,    # 早位：收紧
-        'MP': 0.85,    # 中位：标准
-        'CO': 1.10,    # Cutoff：抢盲位置，放宽
-        'BTN': 1.30,   # 按钮位：最大优势，大幅放宽
-        'SB': 0.90,    # 小盲：位置劣势但可能有价格
-        'BB': 1.00,    # 大盲：最后行动，有价格优势
-    }
+    # 位置价值乘数（影响入池阈值），按Position索引
+    POSITION_MULTIPLIERS = (
+        0.70,    # EP 早位：收紧
+        0.85,    # MP 中位：标准
+        1.10,    # CO Cutoff：抢盲位置，放宽
+        1.30,    # BTN 按钮位：最大优势，大幅放宽
+        0.90,    # SB 小盲：位置劣势但可能有价格
+        1.00,    # BB 大盲：最后行动，有价格优势
+    )
     
     @classmethod
-    def get_position(cls, player: Player, total_players: int = 6) -> str:
+    def get_position(cls, player: Player, total_players: int = 6) -> Position:
         """确定玩家位置"""
         if player.is_dealer:
-            return 'BTN'
+            return Position.BTN
         elif player.is_small_blind:
-            return 'SB'
+            return Position.SB
         elif player.is_big_blind:
-            return 'BB'
+            return Position.BB
         else:
             # 根据与庄家的距离判断
             # 简化处理：6人桌时，BTN前两个是CO和MP，再往前是EP
-            return 'MP'  # 简化处理
+            return Position.MP  # 简化处理
     
     @classmethod
-    def get_adjusted_threshold(cls, base_threshold: float, position: str) -> float:
+    def get_adjusted_threshold(cls, base_threshold: float, position: Position) -> float:
         """根据位置调整入池阈值"""
-        multiplier = cls.POSITION_MULTIPLIERS.get(position, 1.0)
-        return base_threshold * multiplier
+        return base_threshold * cls.POSITION_MULTIPLIERS[position]
+
+
+# 街道编号（get_action 中换算一次，赔率计算按下标取乘数）
+STREET_PREFLOP, STREET_FLOP, STREET_TURN, STREET_RIVER = range(4)
+STREET_IDS = {'preflop': STREET_PREFLOP, 'flop': STREET_FLOP,
+              'turn': STREET_TURN, 'river': STREET_RIVER}
+# 街道编号对应的名称
+STREET_NAMES = ('preflop', 'flop', 'turn', 'river')
+
+
+class Street(IntEnum):
+    """下注街（取值与 STREET_* 编号一致，供调用方按身份比较）"""
+    PREFLOP = STREET_PREFLOP
+    FLOP = STREET_FLOP
+    TURN = STREET_TURN
+    RIVER = STREET_RIVER
+
+
+# 街数乘数（后续还能赢多少），按街道编号索引
+_STREET_MULTIPLIERS = (1.0, 2.5, 1.3, 1.0)
+# 翻牌后加权选择的固定行动顺序，权重列表按此下标写入
+POSTFLOP_ACTIONS = ('fold', 'check', 'call', 'bet', 'raise', 'all_in')
+W_FOLD, W_CHECK, W_CALL, W_BET, W_RAISE, W_ALL_IN = range(6)
+
+# 翻牌后权重分档：total_equity 严格大于某边界即进入上一档
+_POSTFLOP_TIER_BOUNDS = (0.30, 0.45, 0.60, 0.80)
+# 各档权重（fold, check, call, bet, raise, all_in），前两档的 bet 再乘诈唬系数
+_POSTFLOP_TIER_WEIGHTS = (
+    (0.55, 0.35, 0.08, 0.02, 0.0, 0.0),   # 纯弱牌
+    (0.25, 0.30, 0.35, 0.08, 0.0, 0.0),   # 弱牌+听牌
+    (0.10, 0.30, 0.45, 0.15, 0.0, 0.0),   # 中等牌
+    (0.0, 0.05, 0.25, 0.45, 0.25, 0.0),   # 强牌
+    (0.0, 0.0, 0.15, 0.35, 0.50, 0.0),    # 坚果或接近坚果
+)
+
+# 游戏阶段 -> 街道名
+_STREET_MAP = {
+    GameState.PRE_FLOP: 'preflop',
+    GameState.FLOP: 'flop',
+    GameState.TURN: 'turn',
+    GameState.RIVER: 'river',
+    GameState.SHOWDOWN: 'river'
+}
+
+
+def _direct_odds(amount_to_call: int, total_pot: int) -> float:
+    """直接赔率：跟注额 / (底池 + 跟注额)"""
+    if amount_to_call <= 0:
+        return 0.0
+    return amount_to_call / (total_pot + amount_to_call)
+
+
+def _implied(amount_to_call: int, total_pot: int, effective_stack: int,
+             street_id: int, draw_equity: float) -> Tuple[float, float, float, bool]:
+    """隐含赔率，返回 (直接胜率需求, 隐含胜率需求, 未来可赢金额, 是否跟注)
+
+    热路径每次决策调用一次，返回元组以避免构造字典。
+    """
+    if amount_to_call <= 0:
+        return 0.0, 0.0, 0.0, True
+    
+    # 估算后续能赢的平均金额（基于听牌强度和剩余筹码）
+    potential_future_win = min(
+        effective_stack * 0.3 * draw_equity * _STREET_MULTIPLIERS[street_id],
+        effective_stack * 0.5)
+    
+    # 总底池 = 当前底池 + 未来可能赢的
+    total_potential = total_pot + potential_future_win
+    
+    # 直接胜率需求
+    direct_equity_needed = amount_to_call / (total_pot + amount_to_call)
+    
+    # 考虑隐含赔率后的实际胜率需求
+    if total_potential > amount_to_call:
+        implied_equity_needed = amount_to_call / total_potential
+    else:
+        implied_equity_needed = direct_equity_needed
+    
+    # 稍微放宽
+    return (direct_equity_needed, implied_equity_needed, potential_future_win,
+            draw_equity > implied_equity_needed * 0.9)
+
+
+def _spr(effective_stack: int, pot: int) -> float:
+    """SPR = 有效筹码 / 底池"""
+    if pot <= 0:
+        return float('inf')
+    return effective_stack / pot
 
 
 class PotOddsCalculator:
@@ -119,9 +294,7 @@ class PotOddsCalculator:
     @staticmethod
     def calculate_direct_odds(amount_to_call: int, total_pot: int) -> float:
         """计算直接赔率"""
-        if amount_to_call <= 0:
-            return 0.0
-        return amount_to_call / (total_pot + amount_to_call)
+        return _direct_odds(amount_to_call, total_pot)
     
     @staticmethod
     def calculate_implied_odds(amount_to_call: int, total_pot: int, 
@@ -139,89 +312,192 @@ class PotOddsCalculator:
         if amount_to_call <= 0:
             return {'total_equity': 0.0, 'should_call': True}
         
-        # 街数乘数（后续还能赢多少）
-        street_multiplier = {'flop': 2.5, 'turn': 1.3, 'river': 1.0}
-        multiplier = street_multiplier.get(street, 1.0)
-        
-        # 估算后续能赢的平均金额（基于听牌强度和剩余筹码）
-        potential_future_win = min(effective_stack * 0.3 * draw_equity * multiplier, 
-                                   effective_stack * 0.5)
-        
-        # 总底池 = 当前底池 + 未来可能赢的
-        total_potential = total_pot + potential_future_win
-        
-        # 直接胜率需求
-        direct_equity_needed = amount_to_call / (total_pot + amount_to_call)
-        
-        # 考虑隐含赔率后的实际胜率需求
-        if total_potential > amount_to_call:
-            implied_equity_needed = amount_to_call / total_potential
-        else:
-            implied_equity_needed = direct_equity_needed
-        
+        direct, implied, future_win, should_call = _implied(
+            amount_to_call, total_pot, effective_stack,
+            STREET_IDS.get(street, STREET_PREFLOP), draw_equity)
         return {
-            'direct_equity_needed': direct_equity_needed,
-            'implied_equity_needed': implied_equity_needed,
-            'potential_future_win': potential_future_win,
-            'should_call': draw_equity > implied_equity_needed * 0.9  # 稍微放宽
+            'direct_equity_needed': direct,
+            'implied_equity_needed': implied,
+            'potential_future_win': future_win,
+            'should_call': should_call
         }
 
 
 class SPRStrategy:
     """SPR（筹码底池比）策略"""
     
+    # SPR分档边界：<=3 超短筹码，<=7 短筹码，<=15 中等筹码，>15 深筹码
+    SPR_BOUNDS = (3, 7, 15)
+    
+    # 各档策略（中等筹码按是否有强听牌分两种）
+    _PUSH_FOLD = {
+        # 超短筹码：全押或弃牌
+        'play_speculative': False,
+        'set_mine': False,
+        'commit_threshold': 0.45,
+        'avoid_light_commit': False,
+        'hand_requirement': 0.42,
+        'push_fold': True  # 全押或弃牌模式
+    }
+    _SHORT = {
+        # 短筹码：追求全押，不玩投机牌
+        'play_speculative': False,
+        'set_mine': False,
+        'commit_threshold': 0.55,
+        'avoid_light_commit': False,
+        'hand_requirement': 0.48,
+        'push_fold': False
+    }
+    _MEDIUM = {
+        # 中等筹码：平衡策略
+        'play_speculative': False,
+        'set_mine': True,
+        'commit_threshold': 0.65,
+        'avoid_light_commit': False,
+        'hand_requirement': 0.50
+    }
+    _MEDIUM_SPECULATIVE = dict(_MEDIUM, play_speculative=True)
+    _DEEP = {
+        # 深筹码：玩隐含赔率，投机牌有价值
+        'play_speculative': True,
+        'set_mine': True,
+        'commit_threshold': 0.75,
+        'avoid_light_commit': True,
+        'hand_requirement': 0.55
+    }
+    
     @staticmethod
     def calculate_spr(effective_stack: int, pot: int) -> float:
         """计算SPR值"""
-        if pot <= 0:
-            return float('inf')
-        return effective_stack / pot
+        return _spr(effective_stack, pot)
     
     @classmethod
     def get_strategy_by_spr(cls, spr: float, hand_strength: float, 
                            draw_equity: float = 0) -> Dict[str, Any]:
-        """根据SPR和手牌强度获取策略"""
-        
-        total_equity = hand_strength * 0.7 + draw_equity * 0.3
+        """根据SPR和手牌强度获取策略
         
-        if spr > 15:
-            # 深筹码：玩隐含赔率，投机牌有价值
-            return {
-                'play_speculative': True,
-                'set_mine': True,
-                'commit_threshold': 0.75,
-                'avoid_light_commit': True,
-                'hand_requirement': 0.55
-            }
-        elif spr > 7:
-            # 中等筹码：平衡策略
-            return {
-                'play_speculative': draw_equity > 0.25,
-                'set_mine': True,
-                'commit_threshold': 0.65,
-                'avoid_light_commit': False,
-                'hand_requirement': 0.50
-            }
-        elif spr > 3:
-            # 短筹码：追求全押，不玩投机牌
-            return {
-                'play_speculative': False,
-                'set_mine': False,
-                'commit_threshold': 0.55,
-                'avoid_light_commit': False,
-                'hand_requirement': 0.48,
-                'push_fold': False
-            }
-        else:
-            # 超短筹码：全押或弃牌
-            return {
-                'play_speculative': False,
-                'set_mine': False,
-                'commit_threshold': 0.45,
-                'avoid_light_commit': False,
-                'hand_requirement': 0.42,
-                'push_fold': True  # 全押或弃牌模式
-            }
+        返回的字典是共享的，调用方不应修改
+        """
+        tier = bisect_left(cls.SPR_BOUNDS, spr)
+        if tier == 0:
+            return cls._PUSH_FOLD
+        elif tier == 1:
+            return cls._SHORT
+        elif tier == 2:
+            return cls._MEDIUM_SPECULATIVE if draw_equity > 0.25 else cls._MEDIUM
+        return cls._DEEP
+
+
+# 翻牌前候选动作种类（按计划表顺序尝试，第一个可用的即为决策）
+PF_RAISE_BIG, PF_RAISE, PF_BET, PF_CALL, PF_CHECK = range(5)
+
+
+def _plan_preflop(tier: int, position: Position, facing_raise: bool,
+                  should_raise: bool, facing_bet: bool) -> Tuple[int, ...]:
+    """翻牌前决策树的离线展开：返回按优先级排列的候选动作，全部不可用则弃牌
+    
+    Args:
+        tier: 0=超强牌(>=0.80), 1=强牌(>=0.70), 2=中等牌
+        facing_raise: 跟注额超过20
+        should_raise: 本次是否倾向加注（随机）
+        facing_bet: 需要跟注（跟注额>0）
+    """
+    if tier == 0:  # 第1-2组超强牌 (AA-QQ, AKs, AKo)：大加注施压
+        return (PF_RAISE_BIG, PF_BET)
+    
+    if tier == 1:  # 第3组强牌(JJ-TT, AQs等)
+        if position in (Position.EP, Position.MP):
+            plan = (PF_RAISE,) if should_raise else ()
+            if facing_bet:
+                plan += (PF_CALL,)
+            return plan + (PF_CHECK, PF_RAISE)
+        # 后位：加注偷盲
+        return (PF_RAISE, PF_CALL)
+    
+    # 第4组中等牌 (0.60-0.70: 99-88, ATs, KJs等)：只在后位、小额跟注时玩
+    plan = ()
+    if position in (Position.CO, Position.BTN, Position.SB) and not facing_raise:
+        plan = ((PF_RAISE,) if should_raise else ()) + (PF_CALL,)
+    # 早位弃牌这些牌
+    if not facing_bet:
+        plan += (PF_CHECK,)
+    return plan
+
+
+# 翻牌前计划表：(tier, position, facing_raise, should_raise, facing_bet) -> 候选动作
+_PREFLOP_PLANS = {
+    (tier, position, facing_raise, should_raise, facing_bet):
+        _plan_preflop(tier, position, facing_raise, should_raise, facing_bet)
+    for tier in range(3)
+    for position in Position
+    for facing_raise in (False, True)
+    for should_raise in (False, True)
+    for facing_bet in (False, True)
+}
+
+
+class OpponentTable:
+    """对手统计数据表：按列存储（每个字段一个列表），按对手下标访问"""
+    COUNTERS = ('hands_observed', 'folds', 'calls', 'raises', 'bluffs_detected',
+                'bluff_opportunities', 'fold_to_cbet', 'cbet_opportunities',
+                'showdown_wins', 'showdowns')
+    # 倾向值字段及初始值
+    TENDENCIES = (('fold_tendency', 0.5), ('bluff_tendency', 0.5), ('calling_tendency', 0.3))
+    __slots__ = ('names', 'index') + COUNTERS + tuple(name for name, _ in TENDENCIES)
+
+    def __init__(self, names: List[str]):
+        self.names = list(dict.fromkeys(names))
+        self.index = {name: i for i, name in enumerate(self.names)}
+        n = len(self.names)
+        for field in self.COUNTERS:
+            setattr(self, field, [0] * n)
+        for field, initial in self.TENDENCIES:
+            setattr(self, field, [initial] * n)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def row(self, name: str) -> Dict[str, Any]:
+        """以字典形式返回某个对手的全部数据（用于调试/展示）"""
+        i = self.index[name]
+        fields = self.COUNTERS + tuple(field for field, _ in self.TENDENCIES)
+        return {field: getattr(self, field)[i] for field in fields}
+
+
+class SharkConfig:
+    """鲨鱼AI策略参数（固定槽位，决策时按属性读取）"""
+    __slots__ = ('vpip_range', 'pfr_range', 'af_factor', 'bluff_freq',
+                 'call_preflop', 'raise_preflop', 'bet_postflop', 'fold_to_raise',
+                 'adaptation_start', 'learning_rate')
+
+    def __init__(self, vpip_range: Tuple[int, int], pfr_range: Tuple[int, int],
+                 af_factor: float, bluff_freq: float, call_preflop: float,
+                 raise_preflop: float, bet_postflop: float, fold_to_raise: float,
+                 adaptation_start: int, learning_rate: float):
+        self.vpip_range = vpip_range
+        self.pfr_range = pfr_range
+        self.af_factor = af_factor
+        self.bluff_freq = bluff_freq
+        self.call_preflop = call_preflop
+        self.raise_preflop = raise_preflop
+        self.bet_postflop = bet_postflop
+        self.fold_to_raise = fold_to_raise
+        self.adaptation_start = adaptation_start
+        self.learning_rate = learning_rate
+
+    def copy(self) -> 'SharkConfig':
+        """复制一份参数（用于从基础配置派生当前配置）"""
+        return SharkConfig(**self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"SharkConfig({self.to_dict()})"
 
 
 class SharkAI:
@@ -240,27 +516,42 @@ class SharkAI:
     # 前4组包含：AA-88, AKs-A9s, AKo-AJo, KQs-KTs, KQo, QJs-Q9s, QJo, JTs, J9s, T9s
     TIER3_THRESHOLD = 0.60  # 只玩Sklansky前3组强牌(约前16%的手牌)
     
+    # 翻牌前位置阈值乘数（后位放宽），按Position索引: EP, MP, CO, BTN, SB, BB
+    PREFLOP_POSITION_MULTIPLIERS = (1.0, 0.98, 0.95, 0.93, 0.98, 0.95)
+    
     def __init__(self):
         # 初始使用紧凶(TAG)风格，只玩前3组强牌，学习后动态调整
-        self.base_config = {
-            'vpip_range': (12, 18),      # TAG - 紧：只玩好牌
-            'pfr_range': (10, 16),       # TAG - 凶：多数时候加注而非跟注
-            'af_factor': 2.5,            # 高攻击性
-            'bluff_freq': 0.15,          # 适度诈唬
-            'call_preflop': 0.20,        # 少跟注
-            'raise_preflop': 0.25,       # 多加注
-            'bet_postflop': 0.45,        # 翻牌后积极下注
-            'fold_to_raise': 0.60,       # 面对加注容易弃牌（尊重对手）
-            'adaptation_start': 20,
-            'learning_rate': 0.1,
-        }
+        self.base_config = SharkConfig(
+            vpip_range=(12, 18),      # TAG - 紧：只玩好牌
+            pfr_range=(10, 16),       # TAG - 凶：多数时候加注而非跟注
+            af_factor=2.5,            # 高攻击性
+            bluff_freq=0.15,          # 适度诈唬
+            call_preflop=0.20,        # 少跟注
+            raise_preflop=0.25,       # 多加注
+            bet_postflop=0.45,        # 翻牌后积极下注
+            fold_to_raise=0.60,       # 面对加注容易弃牌（尊重对手）
+            adaptation_start=20,
+            learning_rate=0.1,
+        )
         
         # 对手追踪数据
-        self.opponent_data: Dict[str, Dict] = {}
+        self.opponent_data = OpponentTable([])
+        self._opponent_rows = []
+        # 所有对手倾向值之和 [fold, bluff, calling]，随 _calculate_tendencies 增量维护
+        self._tendency_sums = [0.0, 0.0, 0.0]
+        # 上次 _update_strategy 时各阈值的判定结果，未变化则跳过更新
+        self._strategy_flags = None
         self.adaptation_active = False
         self.hands_observed = 0
         self.current_config = self.base_config.copy()
         
+        # 位置缓存：一手牌内位置不变，按玩家缓存，换手（或换游戏状态）时清空
+        self._position_cache: Dict[Player, Position] = {}
+        self._position_state = None
+        self._position_hand = None
+        # 翻牌前入池阈值缓存 (position, adjust_factor) -> 阈值，current_config 变化时清空
+        self._preflop_thresholds: Dict[Tuple[Position, float], float] = {}
+        
         # 子系统
         self.draw_evaluator = DrawEvaluator()
         self.position_awareness = PositionAwareness()
@@ -275,124 +566,162 @@ class SharkAI:
     
     def initialize_opponents(self, players: List[Player]):
         """初始化对手追踪"""
-        self.opponent_data = {}
-        for player in players:
-            if not player.is_ai or getattr(player, 'ai_style', 'LAG') != 'SHARK':
-                self.opponent_data[player.name] = {
-                    'hands_observed': 0,
-                    'folds': 0,
-                    'calls': 0,
-                    'raises': 0,
-                    'bluffs_detected': 0,
-                    'bluff_opportunities': 0,
-                    'fold_to_cbet': 0,
-                    'cbet_opportunities': 0,
-                    'showdown_wins': 0,
-                    'showdowns': 0,
-                    'fold_tendency': 0.5,
-                    'bluff_tendency': 0.5,
-                    'calling_tendency': 0.3,
-                }
+        table = OpponentTable([
+            player.name for player in players
+            if not player.is_ai or player.ai_style != 'SHARK'
+        ])
+        self.opponent_data = table
+        # 玩家下标（在 players 中的位置）-> 对手数据行，鲨鱼自身为 None
+        self._opponent_rows = [table.index.get(player.name) for player in players]
+        self._tendency_sums = [sum(table.fold_tendency), sum(table.bluff_tendency),
+                               sum(table.calling_tendency)]
+        self._strategy_flags = None
+        self._position_cache = {}
+        self._position_state = None
+        self._position_hand = None
+        self._preflop_thresholds = {}
         self.adaptation_active = False
         self.hands_observed = 0
         self.current_config = self.base_config.copy()
     
-    def update_after_action(self, player_name: str, action: str, street: str,
+    def update_after_action(self, player: Union[str, int], action: str, street: str,
                            is_bluff: bool = False, facing_cbet: bool = False):
-        """每轮行动后更新对手数据"""
-        if player_name not in self.opponent_data:
+        """每轮行动后更新对手数据
+        
+        Args:
+            player: 玩家名称，或初始化时 players 列表中的下标（整数下标免去字符串哈希）
+        """
+        table = self.opponent_data
+        if isinstance(player, int):
+            rows = self._opponent_rows
+            i = rows[player] if 0 <= player < len(rows) else None
+        else:
+            i = table.index.get(player)
+        if i is None:
             return
         
-        data = self.opponent_data[player_name]
-        data['hands_observed'] += 1
+        table.hands_observed[i] += 1
         self.hands_observed += 1
         
         if action == 'fold':
-            data['folds'] += 1
+            table.folds[i] += 1
             if facing_cbet:
-                data['fold_to_cbet'] += 1
-        elif action in ['call']:
-            data['calls'] += 1
-        elif action in ['raise', 'bet']:
-            data['raises'] += 1
+                table.fold_to_cbet[i] += 1
+        elif action == 'call':
+            table.calls[i] += 1
+        elif action in ('raise', 'bet'):
+            table.raises[i] += 1
             if is_bluff:
-                data['bluffs_detected'] += 1
+                table.bluffs_detected[i] += 1
         
         if facing_cbet:
-            data['cbet_opportunities'] += 1
+            table.cbet_opportunities[i] += 1
         
         if not self.adaptation_active:
-            total_hands = sum(d['hands_observed'] for d in self.opponent_data.values())
-            if total_hands >= self.base_config['adaptation_start']:
+            total_hands = sum(table.hands_observed)
+            if total_hands >= self.base_config.adaptation_start:
                 self.adaptation_active = True
         
-        if data['hands_observed'] % 5 == 0 or self.adaptation_active:
-            self._calculate_tendencies(player_name)
+        if table.hands_observed[i] % 5 == 0 or self.adaptation_active:
+            self._calculate_tendencies(i)
             if self.adaptation_active:
                 self._update_strategy()
     
-    def _calculate_tendencies(self, player_name: str):
-        """计算对手的倾向值"""
-        data = self.opponent_data[player_name]
-        hands = data['hands_observed']
+    def _calculate_tendencies(self, i: int):
+        """计算第 i 个对手的倾向值"""
+        table = self.opponent_data
+        hands = table.hands_observed[i]
         
         if hands < 3:
             return
         
-        fold_rate = data['folds'] / hands
-        data['fold_tendency'] = min(1.0, max(0.0, fold_rate * 2))
-        
-        if data['raises'] > 0:
-            bluff_rate = data['bluffs_detected'] / data['raises']
-            data['bluff_tendency'] = min(1.0, bluff_rate * 3)
-        
-        if hands > data['folds']:
-            calling_rate = data['calls'] / (hands - data['folds'])
-            data['calling_tendency'] = min(1.0, max(0.0, calling_rate))
+        sums = self._tendency_sums
+        folds = table.folds[i]
+        
+        fold_rate = folds / hands
+        fold_tendency = min(1.0, max(0.0, fold_rate * 2))
+        sums[0] += fold_tendency - table.fold_tendency[i]
+        table.fold_tendency[i] = fold_tendency
+        
+        raises = table.raises[i]
+        if raises > 0:
+            bluff_rate = table.bluffs_detected[i] / raises
+            bluff_tendency = min(1.0, bluff_rate * 3)
+            sums[1] += bluff_tendency - table.bluff_tendency[i]
+            table.bluff_tendency[i] = bluff_tendency
+        
+        if hands > folds:
+            calling_rate = table.calls[i] / (hands - folds)
+            calling_tendency = min(1.0, max(0.0, calling_rate))
+            sums[2] += calling_tendency - table.calling_tendency[i]
+            table.calling_tendency[i] = calling_tendency
+    
+    def _average_tendencies(self) -> Tuple[float, float, float]:
+        """返回 (平均弃牌倾向, 平均诈唬倾向, 平均跟注倾向)，O(1)读取累计和"""
+        fold_sum, bluff_sum, call_sum = self._tendency_sums
+        n = len(self.opponent_data)
+        return fold_sum / n, bluff_sum / n, call_sum / n
     
     def _update_strategy(self):
         """根据对手数据更新当前策略配置"""
         if not self.opponent_data:
             return
         
-        avg_fold = sum(d['fold_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-        avg_bluff = sum(d['bluff_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-        avg_call = sum(d['calling_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
+        avg_fold, avg_bluff, avg_call = self._average_tendencies()
+        
+        # 调整只取决于三个阈值判定，判定结果不变时配置也不会变
+        flags = (avg_fold > 0.6, avg_bluff > 0.4, avg_call > 0.6)
+        if flags == self._strategy_flags:
+            return
+        self._strategy_flags = flags
+        self._preflop_thresholds.clear()
         
         adjustments = []
         
         # 对手容易弃牌 -> 增加诈唬
         if avg_fold > 0.6:
-            self.current_config['bluff_freq'] = min(0.5, self.base_config['bluff_freq'] + 0.15)
-            self.current_config['bet_postflop'] = min(0.7, self.base_config['bet_postflop'] + 0.15)
-            self.current_config['af_factor'] = self.base_config['af_factor'] + 0.5
+            self.current_config.bluff_freq = min(0.5, self.base_config.bluff_freq + 0.15)
+            self.current_config.bet_postflop = min(0.7, self.base_config.bet_postflop + 0.15)
+            self.current_config.af_factor = self.base_config.af_factor + 0.5
             adjustments.append("对手易弃牌→增加诈唬")
         
         # 对手喜欢诈唬 -> 打得更紧
         if avg_bluff > 0.4:
-            self.current_config['vpip_range'] = (
-                max(15, self.base_config['vpip_range'][0] - 5),
-                max(20, self.base_config['vpip_range'][1] - 5)
+            self.current_config.vpip_range = (
+                max(15, self.base_config.vpip_range[0] - 5),
+                max(20, self.base_config.vpip_range[1] - 5)
             )
-            self.current_config['call_preflop'] = min(0.4, self.base_config['call_preflop'] + 0.1)
-            self.current_config['fold_to_raise'] = max(0.3, self.base_config['fold_to_raise'] - 0.1)
+            self.current_config.call_preflop = min(0.4, self.base_config.call_preflop + 0.1)
+            self.current_config.fold_to_raise = max(0.3, self.base_config.fold_to_raise - 0.1)
             adjustments.append("对手爱诈唬→收紧范围")
         
         # 对手跟注站 -> 减少诈唬，增加价值下注
         if avg_call > 0.6:
-            self.current_config['bluff_freq'] = max(0.1, self.base_config['bluff_freq'] - 0.1)
-            self.current_config['bet_postflop'] = self.base_config['bet_postflop'] + 0.1
-            self.current_config['af_factor'] = self.base_config['af_factor'] + 0.3
+            self.current_config.bluff_freq = max(0.1, self.base_config.bluff_freq - 0.1)
+            self.current_config.bet_postflop = self.base_config.bet_postflop + 0.1
+            self.current_config.af_factor = self.base_config.af_factor + 0.3
             adjustments.append("对手跟注多→减少诈唬")
         
         if not adjustments:
             self.current_config = self.base_config.copy()
     
+    def _get_position(self, player: Player, game_state) -> Position:
+        """获取玩家位置（同一手牌内缓存）"""
+        hand_number = getattr(game_state, 'hand_number', None)
+        if game_state is not self._position_state or hand_number != self._position_hand:
+            self._position_cache.clear()
+            self._position_state = game_state
+            self._position_hand = hand_number
+        position = self._position_cache.get(player)
+        if position is None:
+            position = self.position_awareness.get_position(player)
+            self._position_cache[player] = position
+        return position
+    
     def get_action(self, player: Player, betting_round: BettingRound,
                    hand_strength: float, win_probability: float,
                    pot_odds: float, ev: float) -> Tuple[Any, int]:
         """鲨鱼AI主决策方法"""
-        from texas_holdem.utils.constants import Action
         
         # 安全检查
         if player is None or betting_round is None:
@@ -414,15 +743,24 @@ class SharkAI:
             total_pot = 0
         
         # 获取位置信息
-        position = self.position_awareness.get_position(player)
+        position = self._get_position(player, game_state)
         
-        # 计算SPR和有效筹码
+        # 计算有效筹码
         players = game_state.players if hasattr(game_state, 'players') else []
         active_players = [p for p in players if p.is_active]
         self.effective_stack = min(player.chips, 
                                    sum(p.chips for p in active_players) / 
                                    max(1, len(active_players) - 1))
-        spr = self.spr_strategy.calculate_spr(self.effective_stack, total_pot)
+        
+        # 翻牌前牌力不够直接过牌/弃牌（除非大盲可以check），跳过SPR、听牌和赔率计算
+        if game_state.state == GameState.PRE_FLOP and hand_strength < self._preflop_threshold(position):
+            self.current_street = 'preflop'
+            if amount_to_call <= 0 and Action.CHECK in available_actions:
+                return Action.CHECK, 0
+            return Action.FOLD, 0
+        
+        # 计算SPR
+        spr = _spr(self.effective_stack, total_pot)
         
         # 识别听牌
         hole_cards = player.hand.cards if player.hand else []
@@ -431,14 +769,8 @@ class SharkAI:
         draw_equity = self.draw_evaluator.calculate_total_equity(draws)
         
         # 确定当前街
-        street_map = {
-            GameState.PRE_FLOP: 'preflop',
-            GameState.FLOP: 'flop',
-            GameState.TURN: 'turn',
-            GameState.RIVER: 'river',
-            GameState.SHOWDOWN: 'river'
-        }
-        self.current_street = street_map.get(game_state.state, 'preflop')
+        self.current_street = _STREET_MAP.get(game_state.state, 'preflop')
+        street_id = STREET_IDS[self.current_street]
         
         config = self.current_config
         is_preflop = (game_state.state == GameState.PRE_FLOP)
@@ -447,11 +779,9 @@ class SharkAI:
         total_equity = win_probability + draw_equity * 0.5
         
         # 计算精确赔率
-        direct_odds = self.pot_odds_calc.calculate_direct_odds(amount_to_call, total_pot)
-        implied_calc = self.pot_odds_calc.calculate_implied_odds(
-            amount_to_call, total_pot, self.effective_stack, 
-            self.current_street, draw_equity
-        )
+        direct_odds = _direct_odds(amount_to_call, total_pot)
+        should_call_draw = _implied(amount_to_call, total_pot, self.effective_stack,
+                                    street_id, draw_equity)[3]
         
         # SPR策略指导
         spr_guidance = self.spr_strategy.get_strategy_by_spr(spr, hand_strength, draw_equity)
@@ -463,8 +793,7 @@ class SharkAI:
                 hand_strength, position, spr_guidance, config
             )
             # 记录是否是翻牌前加注者（用于后续CBet决策）
-            action_str_returned = str(action).lower()
-            if 'raise' in action_str_returned or action_str_returned == 'bet':
+            if action == Action.RAISE or action == Action.BET:
                 self.is_preflop_raiser = True
             # 如果是call/check/fold，保持之前的值不变
             return action, amount
@@ -473,135 +802,98 @@ class SharkAI:
         return self._postflop_decision(
             player, available_actions, amount_to_call, current_bet,
             hand_strength, draw_equity, total_equity, direct_odds, 
-            implied_calc, spr_guidance, config, draws, total_pot,
+            should_call_draw, spr_guidance, config, draws, total_pot,
             is_preflop_raiser=self.is_preflop_raiser
         )
     
-    def _preflop_decision(self, player, available_actions, amount_to_call,
-                         hand_strength, position, spr_guidance, config) -> Tuple[Any, int]:
-        """翻牌前决策 - TAG风格，根据学习机制动态调整"""
-        from texas_holdem.utils.constants import Action
-        import random
-        
-        available_names = [str(a).lower().replace('action.', '') for a in available_actions]
-        
-        # 使用学习后的配置动态调整阈值
-        # 如果对手爱诈唬，收紧范围；如果对手易弃牌，放宽范围
-        base_threshold = self.TIER3_THRESHOLD
-        vpip_min, vpip_max = self.current_config['vpip_range']
-        base_vpip = (vpip_min + vpip_max) / 2 / 100  # 转换为0-1范围
-        
-        # 根据VPIP目标调整阈值 (0.15 -> 0.60, 0.20 -> 0.55)
-        threshold_adjustment = (0.20 - base_vpip) * 0.5  # 学习调整
-        tier_threshold = base_threshold + threshold_adjustment
-        
-        # 位置调整（后位放宽），根据fold_to_raise调整
-        fold_to_raise = self.current_config['fold_to_raise']
-        base_multipliers = {'EP': 1.0, 'MP': 0.98, 'CO': 0.95, 'BTN': 0.93, 'SB': 0.98, 'BB': 0.95}
-        
+    def _preflop_threshold(self, position: Position) -> float:
+        """翻牌前入池阈值（按位置和对手调整系数缓存，配置变化时清空）"""
         # 如果对手容易弃牌，后位可以更松；如果对手诈唬多，收紧范围
         adjust_factor = 1.0
         if self.adaptation_active:
-            avg_fold = sum(d['fold_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
-            avg_bluff = sum(d['bluff_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
+            avg_fold, avg_bluff, _ = self._average_tendencies()
             
             if avg_fold > 0.6:
                 adjust_factor = 0.95  # 对手易弃牌，放宽5%
             elif avg_bluff > 0.4:
                 adjust_factor = 1.05  # 对手爱诈唬，收紧5%
         
-        position_multipliers = {k: v * adjust_factor for k, v in base_multipliers.items()}
-        adjusted_threshold = tier_threshold * position_multipliers.get(position, 1.0)
+        key = (position, adjust_factor)
+        threshold = self._preflop_thresholds.get(key)
+        if threshold is None:
+            # 使用学习后的配置动态调整阈值
+            vpip_min, vpip_max = self.current_config.vpip_range
+            base_vpip = (vpip_min + vpip_max) / 2 / 100  # 转换为0-1范围
+            
+            # 根据VPIP目标调整阈值 (0.15 -> 0.60, 0.20 -> 0.55)
+            threshold_adjustment = (0.20 - base_vpip) * 0.5  # 学习调整
+            tier_threshold = self.TIER3_THRESHOLD + threshold_adjustment
+            
+            # 位置调整（后位放宽）
+            threshold = tier_threshold * (self.PREFLOP_POSITION_MULTIPLIERS[position] * adjust_factor)
+            self._preflop_thresholds[key] = threshold
+        return threshold
+    
+    def _preflop_decision(self, player, available_actions, amount_to_call,
+                         hand_strength, position, spr_guidance, config) -> Tuple[Any, int]:
+        """翻牌前决策 - TAG风格，根据学习机制动态调整（牌力不够的手牌已在 get_action 中弃牌）"""
+        import random
         
-        # 牌力不够直接弃牌（除非大盲可以check）
-        if hand_strength < adjusted_threshold:
-            if amount_to_call <= 0 and 'check' in available_names:
-                return Action.CHECK, 0
-            return Action.FOLD, 0
+        avail = frozenset(available_actions)
         
         # 强牌分组决策 - 根据raise_preflop调整加注倾向
-        raise_preflop = self.current_config['raise_preflop']
+        raise_preflop = self.current_config.raise_preflop
         should_raise = random.random() < raise_preflop
         
-        if hand_strength >= 0.80:  # 第1-2组超强牌 (AA-QQ, AKs, AKo)
-            if 'raise' in available_names:
-                # TAG风格：大加注施压
-                raise_amount = max(40, amount_to_call + 30)
-                # 确保不超过筹码
-                if raise_amount >= player.chips:
-                    return Action.ALL_IN, player.chips
-                return Action.RAISE, raise_amount
-            elif 'bet' in available_names:
-                bet_amount = min(40, player.chips)
-                return Action.BET, bet_amount
-        
-        elif hand_strength >= 0.70:  # 第3组强牌(JJ-TT, AQs等)
-            if position in ['EP', 'MP']:
-                # 根据配置决定跟注还是加注
-                if should_raise and 'raise' in available_names:
-                    raise_amount = min(40, player.chips)
-                    if raise_amount >= player.chips:
-                        return Action.ALL_IN, player.chips
-                    return Action.RAISE, raise_amount
-                elif amount_to_call > 0 and 'call' in available_names:
-                    # 确保能支付跟注
-                    if amount_to_call >= player.chips:
-                        return Action.ALL_IN, player.chips
-                    return Action.CALL, 0
-                elif 'check' in available_names:
-                    return Action.CHECK, 0
-                elif 'raise' in available_names:
-                    raise_amount = min(40, player.chips)
-                    if raise_amount >= player.chips:
-                        return Action.ALL_IN, player.chips
+        tier = 0 if hand_strength >= 0.80 else 1 if hand_strength >= 0.70 else 2
+        plan = _PREFLOP_PLANS[(tier, position, amount_to_call > 20,
+                               should_raise, amount_to_call > 0)]
+        
+        chips = player.chips
+        for kind in plan:
+            if kind == PF_RAISE_BIG:
+                if Action.RAISE in avail:
+                    raise_amount = max(40, amount_to_call + 30)
+                    # 确保不超过筹码
+                    if raise_amount >= chips:
+                        return Action.ALL_IN, chips
                     return Action.RAISE, raise_amount
-            else:
-                # 后位：加注偷盲
-                if 'raise' in available_names:
-                    raise_amount = min(40, player.chips)
-                    if raise_amount >= player.chips:
-                        return Action.ALL_IN, player.chips
+            elif kind == PF_RAISE:
+                if Action.RAISE in avail:
+                    raise_amount = min(40, chips)
+                    if raise_amount >= chips:
+                        return Action.ALL_IN, chips
                     return Action.RAISE, raise_amount
-                elif 'call' in available_names:
-                    if amount_to_call >= player.chips:
-                        return Action.ALL_IN, player.chips
-                    return Action.CALL, 0
-        
-        else:  # 第4组中等牌 (0.60-0.70: 99-88, ATs, KJs等)
-            if position in ['CO', 'BTN', 'SB']:  # 只在后位玩
-                if should_raise and 'raise' in available_names and amount_to_call <= 20:
-                    raise_amount = min(40, player.chips)
-                    if raise_amount >= player.chips:
-                        return Action.ALL_IN, player.chips
-                    return Action.RAISE, raise_amount  # 偷盲
-                elif 'call' in available_names and amount_to_call <= 20:
-                    if amount_to_call >= player.chips:
-                        return Action.ALL_IN, player.chips
+            elif kind == PF_BET:
+                if Action.BET in avail:
+                    return Action.BET, min(40, chips)
+            elif kind == PF_CALL:
+                if Action.CALL in avail:
+                    # 确保能支付跟注
+                    if amount_to_call >= chips:
+                        return Action.ALL_IN, chips
                     return Action.CALL, 0
-            # 早位弃牌这些牌
-            if amount_to_call <= 0 and 'check' in available_names:
+            elif Action.CHECK in avail:
                 return Action.CHECK, 0
-            return Action.FOLD, 0
         
         # 默认弃牌
         return Action.FOLD, 0
     
     def _postflop_decision(self, player, available_actions, amount_to_call,
                           current_bet, hand_strength, draw_equity, total_equity,
-                          direct_odds, implied_calc, spr_guidance, config, draws, total_pot,
+                          direct_odds, should_call_draw, spr_guidance, config, draws, total_pot,
                           is_preflop_raiser=False) -> Tuple[Any, int]:
         """
         翻牌后决策 - 自适应学习版
         根据对手数据动态调整策略
         """
-        from texas_holdem.utils.constants import Action
         
-        available_names = [str(a).lower().replace('action.', '') for a in available_actions]
+        avail = frozenset(available_actions)
         
         # 获取学习后的配置
-        bluff_freq = self.current_config['bluff_freq']
-        bet_postflop = self.current_config['bet_postflop']
-        af_factor = self.current_config['af_factor']
+        bluff_freq = self.current_config.bluff_freq
+        bet_postflop = self.current_config.bet_postflop
+        af_factor = self.current_config.af_factor
         
         # 超短筹码全押或弃牌模式
         if spr_guidance.get('push_fold', False):
@@ -621,7 +913,7 @@ class SharkAI:
             pure_bluff_freq = bluff_freq  # 使用学习后的诈唬频率
             
             if self.adaptation_active:
-                avg_fold = sum(d['fold_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
+                avg_fold = self._average_tendencies()[0]
                 if avg_fold > 0.6:
                     # 对手易弃牌，降低CBet阈值，增加诈唬
                     cbet_threshold = 0.35
@@ -634,28 +926,28 @@ class SharkAI:
                     pure_bluff_freq = max(0.05, bluff_freq - 0.05)
             
             if total_strength >= cbet_threshold:  # 有摊牌价值或听牌
-                if 'bet' in available_names:
+                if Action.BET in avail:
                     bet_size = max(40, int(total_pot * (0.66 + (af_factor - 2.5) * 0.05)))
                     bet_size = min(bet_size, player.chips)
                     if bet_size >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.BET, bet_size
             elif draw_equity >= semi_bluff_threshold:  # 有听牌，半诈唬
-                if 'bet' in available_names:
+                if Action.BET in avail:
                     bet_size = max(40, int(total_pot * 0.60))
                     bet_size = min(bet_size, player.chips)
                     if bet_size >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.BET, bet_size
             elif random.random() < pure_bluff_freq:  # 纯诈唬CBet - 使用学习频率
-                if 'bet' in available_names:
+                if Action.BET in avail:
                     bet_size = max(40, int(total_pot * 0.50))
                     bet_size = min(bet_size, player.chips)
                     if bet_size >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.BET, bet_size
             # 否则check
-            if 'check' in available_names:
+            if Action.CHECK in avail:
                 return Action.CHECK, 0
         
         # ===== 非CBet情况下的翻牌后决策 =====
@@ -664,13 +956,13 @@ class SharkAI:
         
         # 有听牌时的决策
         if draw_equity > 0.15:
-            if implied_calc['should_call'] and 'call' in available_names:
+            if should_call_draw and Action.CALL in avail:
                 if amount_to_call >= player.chips:
                     return Action.ALL_IN, player.chips
                 return Action.CALL, 0
             # 强听牌可以半诈唬加注 - 根据af_factor调整
             semi_bluff_raise_threshold = 0.30 - (af_factor - 2.5) * 0.02
-            if draw_equity > semi_bluff_raise_threshold and 'raise' in available_names and hand_strength < 0.5:
+            if draw_equity > semi_bluff_raise_threshold and Action.RAISE in avail and hand_strength < 0.5:
                 raise_size = max(40, current_bet + int(total_pot * 0.5))
                 if raise_size >= player.chips:
                     return Action.ALL_IN, player.chips
@@ -679,43 +971,43 @@ class SharkAI:
         # 基于强度的决策 - 使用动态阈值
         if total_strength >= bet_threshold:  # 强牌 - 激进价值下注
             if current_bet == 0:
-                if 'bet' in available_names:
+                if Action.BET in avail:
                     bet_size = max(40, int(total_pot * (0.75 + (af_factor - 2.5) * 0.03)))
                     if bet_size >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.BET, bet_size
             else:
-                if 'raise' in available_names:
+                if Action.RAISE in avail:
                     raise_size = max(40, current_bet + int(total_pot * 0.5))
                     if raise_size >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.RAISE, raise_size
-                elif 'call' in available_names:
+                elif Action.CALL in avail:
                     if amount_to_call >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.CALL, 0
         
         elif total_strength >= 0.45:  # 中等牌
             if amount_to_call <= total_pot * 0.3:  # 赔率合适
-                if 'call' in available_names:
+                if Action.CALL in avail:
                     if amount_to_call >= player.chips:
                         return Action.ALL_IN, player.chips
                     return Action.CALL, 0
-            if current_bet == 0 and 'check' in available_names:
+            if current_bet == 0 and Action.CHECK in avail:
                 return Action.CHECK, 0
         
         elif total_strength >= 0.30 or draw_equity > 0.15:  # 弱牌+听牌
             # 根据对手跟注倾向调整
             should_call = False
             if self.adaptation_active:
-                avg_call = sum(d['calling_tendency'] for d in self.opponent_data.values()) / len(self.opponent_data)
+                avg_call = self._average_tendencies()[2]
                 if avg_call > 0.5 and amount_to_call > 0:
                     # 对手跟注多，不诈唬，弃牌
                     pass
-                elif implied_calc['should_call'] and 'call' in available_names:
+                elif should_call_draw and Action.CALL in avail:
                     should_call = True
             else:
-                if implied_calc['should_call'] and 'call' in available_names:
+                if should_call_draw and Action.CALL in avail:
                     should_call = True
             
             if should_call:
@@ -723,60 +1015,27 @@ class SharkAI:
                     return Action.ALL_IN, player.chips
                 return Action.CALL, 0
             
-            if 'check' in available_names:
+            if Action.CHECK in avail:
                 return Action.CHECK, 0
         
         # 默认行为
         if amount_to_call > 0:
             return Action.FOLD, 0
-        elif 'check' in available_names:
+        elif Action.CHECK in avail:
             return Action.CHECK, 0
         return Action.FOLD, 0
     
     def _calculate_postflop_weights(self, hand_strength: float, draw_equity: float,
-                                    config: Dict, spr_guidance: Dict) -> Dict[str, float]:
-        """计算翻牌后行动权重"""
-        weights = {'fold': 0, 'check': 0, 'call': 0, 'bet': 0, 'raise': 0, 'all_in': 0}
-        
+                                    config: SharkConfig, spr_guidance: Dict) -> List[float]:
+        """计算翻牌后行动权重，按 POSTFLOP_ACTIONS 顺序返回"""
         total_equity = hand_strength * 0.7 + draw_equity * 0.3
-        bluff_freq = config['bluff_freq']
-        af = config['af_factor']
-        
-        if total_equity > 0.80:  # 坚果或接近坚果
-            weights.update({
-                'raise': 0.50,
-                'bet': 0.35,
-                'call': 0.15
-            })
-        elif total_equity > 0.60:  # 强牌
-            weights.update({
-                'bet': 0.45,
-                'raise': 0.25,
-                'call': 0.25,
-                'check': 0.05
-            })
-        elif total_equity > 0.45:  # 中等牌
-            weights.update({
-                'call': 0.45,
-                'check': 0.30,
-                'bet': 0.15,
-                'fold': 0.10
-            })
-        elif total_equity > 0.30 or draw_equity > 0.15:  # 弱牌+听牌
-            weights.update({
-                'call': 0.35,
-                'check': 0.30,
-                'fold': 0.25,
-                'bet': 0.08 * bluff_freq * 10
-            })
-        else:  # 纯弱牌
-            weights.update({
-                'fold': 0.55,
-                'check': 0.35,
-                'call': 0.08,
-                'bet': 0.02 * bluff_freq * 10
-            })
+        tier = bisect_left(_POSTFLOP_TIER_BOUNDS, total_equity)
+        if tier == 0 and draw_equity > 0.15:  # 弱牌但有听牌
+            tier = 1
         
+        weights = list(_POSTFLOP_TIER_WEIGHTS[tier])
+        if tier <= 1:
+            weights[W_BET] = weights[W_BET] * config.bluff_freq * 10
         return weights
     
     def _calculate_amount(self, action, player, amount_to_call, current_bet,
@@ -792,7 +1051,7 @@ class SharkAI:
             total_pot = 100  # 默认底池
         
         big_blind = 20
-        af = config['af_factor']
+        af = config.af_factor
         total_strength = hand_strength + draw_equity * 0.5
         
         # 基于底池百分比计算下注额（标准扑克下注尺度）
@@ -834,19 +1093,15 @@ class SharkAI:
             min_raise = big_blind * 2
             return max(min_raise, raise_amount)
     
-    def _weighted_choice(self, weights: Dict[str, float]) -> str:
-        """加权随机选择"""
-        total = sum(weights.values())
+    def _weighted_choice(self, weights: List[float]) -> str:
+        """加权随机选择（weights 按 POSTFLOP_ACTIONS 顺序）"""
+        cumulative = list(accumulate(weights))
+        total = cumulative[-1]
         if total == 0:
             return 'fold'
         
         r = random.random() * total
-        cumulative = 0
-        for action, weight in weights.items():
-            cumulative += weight
-            if r <= cumulative:
-                return action
-        return list(weights.keys())[-1]
+        return POSTFLOP_ACTIONS[bisect_left(cumulative, r)]
     
     def get_opponent_summary(self) -> str:
         """获取对手分析摘要"""
@@ -854,12 +1109,15 @@ class SharkAI:
             return "[鲨鱼AI] 观察中..."
         
         summaries = []
-        for name, data in self.opponent_data.items():
-            if data['hands_observed'] >= 5:
-                fold_desc = "易弃牌" if data['fold_tendency'] > 0.6 else \
-                           "难弃牌" if data['fold_tendency'] < 0.4 else "中等"
-                bluff_desc = "爱诈唬" if data['bluff_tendency'] > 0.4 else \
-                            "诚实" if data['bluff_tendency'] < 0.2 else "平衡"
+        table = self.opponent_data
+        for i, name in enumerate(table.names):
+            if table.hands_observed[i] >= 5:
+                fold_tendency = table.fold_tendency[i]
+                bluff_tendency = table.bluff_tendency[i]
+                fold_desc = "易弃牌" if fold_tendency > 0.6 else \
+                           "难弃牌" if fold_tendency < 0.4 else "中等"
+                bluff_desc = "爱诈唬" if bluff_tendency > 0.4 else \
+                            "诚实" if bluff_tendency < 0.2 else "平衡"
                 summaries.append(f"{name}({fold_desc}/{bluff_desc})")
         
         if summaries:
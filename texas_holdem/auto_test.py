@@ -85,7 +85,7 @@ class AutoCLI(CLI):
     def _get_shark_player(self):
         """获取鲨鱼玩家"""
         for player in self.game_engine.players:
-            if getattr(player, 'ai_style', '') == 'SHARK':
+            if player.ai_style == 'SHARK':
                 return player
         return None
     
@@ -138,7 +138,7 @@ class AutoCLI(CLI):
     
     def _run_betting_round_auto(self):
         """自动运行下注轮"""
-        from texas_holdem.game.betting import BettingRound
+        from texas_holdem.game.betting import BettingRound, RoundStatus
         
         betting_round = BettingRound(self.game_engine.game_state)
         self.current_betting_round = betting_round
@@ -159,21 +159,20 @@ class AutoCLI(CLI):
                 continue
             
             # 更新鲨鱼追踪
-            if getattr(current_player, 'ai_style', '') != 'SHARK':
+            if current_player.ai_style != 'SHARK':
                 action_str = action.name.lower() if hasattr(action, 'name') else str(action).lower()
                 street = str(self.game_engine.game_state.state).lower()
                 self.shark_ai.update_after_action(current_player.name, action_str, street)
             
             # 执行行动
-            success, msg, bet_amount = betting_round.process_action(current_player, action, amount)
-            if success:
+            status, msg, bet_amount = betting_round.process_action(current_player, action, amount)
+            if status:
                 self._update_player_stats(current_player, action, bet_amount)
             
             action_count += 1
             
             # 检查是否只剩一个玩家
-            active_players = [p for p in self.game_engine.players if p.is_active]
-            if len(active_players) <= 1:
+            if status is RoundStatus.HAND_OVER:
                 return False
         
         # 收集下注
@@ -198,7 +197,7 @@ class AutoCLI(CLI):
         if len(active_players) == 1:
             winner = active_players[0]
             winner.chips += game_state.table.total_pot
-            if getattr(winner, 'ai_style', '') == 'SHARK':
+            if winner.ai_style == 'SHARK':
                 self.shark_stats['wins'] += 1
             return
         
@@ -227,7 +226,7 @@ class AutoCLI(CLI):
             win_amount = game_state.table.total_pot // len(winners)
             for winner in winners:
                 winner.chips += win_amount
-                if getattr(winner, 'ai_style', '') == 'SHARK':
+                if winner.ai_style == 'SHARK':
                     self.shark_stats['wins'] += 1
 
 
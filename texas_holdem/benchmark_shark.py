@@ -15,30 +15,81 @@ sys.path.insert(0, 'd:\\workspace\\Texes')
 from texas_holdem.game.game_engine import GameEngine
 from texas_holdem.game.game_state import GameState
 from texas_holdem.ai.ai_engine import AIEngine
-from texas_holdem.ai.shark_ai import SharkAI
-from texas_holdem.utils.constants import INITIAL_CHIPS, GameState as GS
+from texas_holdem.ai.shark_ai import SharkAI, Street, STREET_NAMES
+import texas_holdem.utils.constants as constants
+from texas_holdem.utils.constants import INITIAL_CHIPS, Action, GameState as GS
 
+# 计入VPIP（主动入池）的行动
+VPIP_ACTIONS = frozenset((Action.RAISE, Action.CALL, Action.BET))
+# 主动下注/加注的行动（CBet判定）
+AGGRESSIVE_ACTIONS = frozenset((Action.BET, Action.RAISE))
+# 参赛玩家（按座位顺序）及其AI风格
+AI_STYLES = {
+    '电脑1号[鲨鱼]': 'SHARK',
+    '电脑2号[松凶]': 'LAG',
+    '电脑3号[紧凶]': 'TAG',
+    '电脑4号[紧弱]': 'LAP',
+    '电脑5号[松弱]': 'LP',
+    '电脑6号[紧凶]': 'TAG',
+}
+# 多轮汇总时取平均的统计字段（顺序与汇总报告中的平均值一一对应）
+SUMMARY_FIELDS = ('hands_played', 'profit', 'hands_won', 'vpip', 'pfr',
+                  'three_bet_pct', 'cbet_pct', 'fold_to_3bet_pct', 'final_rank')
+
+
+class _NullIO(io.IOBase):
+    """丢弃所有写入的输出流（替代 StringIO，避免缓冲区无限增长）"""
+    
+    def write(self, s):
+        return len(s)
+    
+    def writable(self):
+        return True
 
 class SilentGameRunner:
     """静默运行游戏，不输出到控制台"""
     
-    def __init__(self, max_hands: int = 10000):
+    def __init__(self, max_hands: int = 10000, strict: bool = True):
         """
         初始化测试运行器
         
         Args:
             max_hands: 最大手牌数（防止无限循环），默认10000手
+            strict: 严格模式，手牌运行中的异常直接抛出而不是静默跳过该手牌
         """
-        self.max_hands = max_hands
+        self.strict = strict
+        # AI引擎与鲨鱼AI可跨轮复用（setup_game 会重新初始化对手追踪）
         self.ai_engine = AIEngine()
         self.shark_ai = SharkAI()
+        # 本手牌的手牌强度缓存：(玩家, 公共牌张数) -> 强度，每手牌开始时清空
+        self._hs_cache = {}
         
         # 盲注升级设置
-        self.blind_level = 1  # 当前盲注级别
         self.hands_per_level = 100  # 每100手升级一次
         self.base_small_blind = 10   # 初始小盲
         self.base_big_blind = 20     # 初始大盲
         
+        self.reset(max_hands)
+    
+    def reset(self, max_hands: int = None):
+        """
+        重置每轮测试的可变状态，以便同一个运行器复用于下一轮
+        （游戏引擎在 run_benchmark 的 setup_game 中重建）
+        
+        Args:
+            max_hands: 新的最大手牌数，None 表示保持不变
+        """
+        if max_hands is not None:
+            self.max_hands = max_hands
+        self._shark = None  # 鲨鱼玩家（setup_game 时确定）
+        self._hs_cache.clear()
+        self._progress_out = None  # 进度输出流，None 表示静默
+        
+        # 盲注回到初始级别（run_hand 升级盲注时会修改全局常量）
+        self.blind_level = 1  # 当前盲注级别
+        constants.SMALL_BLIND = self.base_small_blind
+        constants.BIG_BLIND = self.base_big_blind
+        
         # 统计结果
         self.shark_stats = {
             'hands_played': 0,
@@ -144,9 +195,6 @@ class SilentGameRunner:
             'showdown_checkdown': 0,       # 免费看牌到摊牌次数
         }
         
-        # 每手牌的结果记录
-        self.hand_results = []
-        
         # VPIP/PFR跟踪（每手牌重置）
         self.hand_vpip_recorded = False
         self.hand_pfr_recorded = False
@@ -163,46 +211,28 @@ class SilentGameRunner:
         
     def setup_game(self):
         """设置游戏 - 6个AI玩家"""
-        player_names = [
-            '电脑1号[鲨鱼]',
-            '电脑2号[松凶]', 
-            '电脑3号[紧凶]',
-            '电脑4号[紧弱]',
-            '电脑5号[松弱]',
-            '电脑6号[紧凶]'
-        ]
-        
-        self.engine = GameEngine(player_names, INITIAL_CHIPS)
+        self.engine = GameEngine(list(AI_STYLES), INITIAL_CHIPS)
         
         # 设置AI风格
-        style_map = {
-            '紧凶': 'TAG',
-            '松凶': 'LAG',
-            '紧弱': 'LAP', 
-            '松弱': 'LP',
-            '鲨鱼': 'SHARK'
-        }
-        
         for player in self.engine.players:
             player.is_ai = True
-            if '[' in player.name and ']' in player.name:
-                cn_style = player.name.split('[')[1].split(']')[0]
-                player.ai_style = style_map.get(cn_style, 'LAG')
+            player.ai_style = AI_STYLES.get(player.name, 'LAG')
+        
+        # 缓存鲨鱼玩家，后续按身份比较
+        self._shark = next((p for p in self.engine.players
+                            if p.ai_style == 'SHARK'), None)
         
         # 初始化鲨鱼AI
         self.shark_ai.initialize_opponents(self.engine.players)
         
         # 获取鲨鱼初始筹码
-        shark = self._get_shark()
+        shark = self._shark
         if shark:
             self.shark_start_chips = shark.chips
             
     def _get_shark(self):
         """获取鲨鱼玩家"""
-        for p in self.engine.players:
-            if getattr(p, 'ai_style', '') == 'SHARK':
-                return p
-        return None
+        return self._shark
     
     def _get_shark_position(self, shark) -> str:
         """获取鲨鱼的位置"""
@@ -219,7 +249,7 @@ class SilentGameRunner:
             
             # 找到鲨鱼的索引
             for i, p in enumerate(self.engine.players):
-                if p.name == shark.name:
+                if p is shark:
                     # 6人桌: BTN, SB, BB, UTG, MP, CO
                     if player_count == 6:
                         if i == 0: return 'BTN'
@@ -296,13 +326,16 @@ class SilentGameRunner:
     
     def _get_ai_action(self, player, betting_round):
         """获取AI行动"""
-        from texas_holdem.utils.constants import Action
-        
         game_state = betting_round.game_state
         hole_cards = player.hand.cards if player.hand else []
         community_cards = game_state.table.community_cards
         
-        hand_strength = self.ai_engine.evaluate_hand_strength(hole_cards, community_cards)
+        # 同一街内底牌和公共牌都不变，每名玩家只评估一次
+        key = (player, len(community_cards))
+        hand_strength = self._hs_cache.get(key)
+        if hand_strength is None:
+            hand_strength = self.ai_engine.evaluate_hand_strength(hole_cards, community_cards)
+            self._hs_cache[key] = hand_strength
         win_prob = hand_strength
         
         amount_to_call = betting_round.get_amount_to_call(player)
@@ -324,123 +357,139 @@ class SilentGameRunner:
         return action, amount, hand_strength
     
     def run_hand(self, hand_num: int) -> bool:
-        """运行一手牌"""
+        """
+        运行一手牌
+        
+        严格模式下异常直接抛出以暴露问题；否则出错的手牌按未完成处理（返回False）
+        """
+        if self.strict:
+            return self._run_hand_inner(hand_num)
         try:
-            # 检查鲨鱼是否被淘汰
-            shark = self._get_shark()
-            if not shark or shark.chips <= 0:
-                if not self.shark_stats['eliminated']:
-                    self.shark_stats['eliminated'] = True
-                    self.shark_stats['eliminated_at'] = hand_num
-                return False
-            
-            # 开始新一手
-            self.engine.start_new_hand()
-            self.shark_stats['hands_played'] += 1
-            
-            # DEBUG: 检查is_preflop_raiser重置
-            # print(f"  DEBUG: 新手牌开始，is_preflop_raiser={self.shark_ai.is_preflop_raiser}")
-            
-            # 检查盲注升级（每1000手翻倍）
-            new_level = (hand_num - 1) // self.hands_per_level + 1
-            if new_level > self.blind_level:
-                self.blind_level = new_level
-                multiplier = 2 ** (self.blind_level - 1)  # 2的(级别-1)次方
-                import texas_holdem.utils.constants as constants
-                constants.SMALL_BLIND = self.base_small_blind * multiplier
-                constants.BIG_BLIND = self.base_big_blind * multiplier
-                print(f"  *** 盲注升级！第{self.blind_level}级: {constants.SMALL_BLIND}/{constants.BIG_BLIND} ***")
-            
-            # 每10手牌输出一次进度（用于调试卡顿问题）
-            if hand_num % 10 == 0:
-                print(f"  进度: 第{hand_num}手牌，鲨鱼筹码: {shark.chips if shark else 0}，盲注: {constants.SMALL_BLIND}/{constants.BIG_BLIND}")
-            
-            # 重置本手牌跟踪数据（确保每手牌只统计一次）
-            self.hand_vpip_recorded = False
-            self.hand_pfr_recorded = False
-            self.hand_3bet_recorded = False
-            self.hand_steal_recorded = False      # 偷盲每手牌只计一次
-            self.hand_cbet_recorded = False       # CBet机会每手牌只计一次
-            self.hand_bb_defend_recorded = False  # 大盲防守每手牌只计一次
-            self.shark_ai.is_preflop_raiser = False  # 重置翻牌前加注者标记
-            self.current_hand = {
-                'shark_position': self._get_shark_position(shark),
-                'shark_hand_rank': self._classify_hand(shark.hand.cards if shark.hand else []),
-                'preflop_raiser': False,
-                'current_street': 'preflop',
-                'pot_before_showdown': 0,
-            }
-            
-            # 记录手牌分类统计
-            hand_rank = self.current_hand['shark_hand_rank']
-            if hand_rank == 'premium':
-                self.shark_stats['premium_hands'] += 1
-            elif hand_rank == 'strong':
-                self.shark_stats['strong_hands'] += 1
-            elif hand_rank == 'playable':
-                self.shark_stats['playable_hands'] += 1
-            else:
-                self.shark_stats['weak_hands'] += 1
-            
-            # 记录位置统计
-            position = self.current_hand['shark_position']
-            self.shark_stats['hands_by_position'][position] += 1
-            
-            # 记录鲨鱼初始筹码
-            shark_start_chips = shark.chips if shark else 0
-            
-            # 运行翻牌前
-            if not self._run_betting_round('preflop'):
-                self._check_winner(shark_start_chips)
-                return True
-            
-            # DEBUG: 检查翻牌前结束后的状态
-            # print(f"  DEBUG: 翻牌前结束，is_preflop_raiser={self.shark_ai.is_preflop_raiser}")
-            
-            # 翻牌圈
-            active = len([p for p in self.engine.players if p.is_active])
-            if active > 1:
-                self.engine.deal_flop()
-                self.engine.game_state.advance_stage()
-                self.shark_stats['saw_flop_count'] += 1
-                self.current_hand['current_street'] = 'flop'
-                if not self._run_betting_round('flop'):
-                    self._check_winner(shark_start_chips)
-                    return True
-            
-            # 转牌圈
-            active = len([p for p in self.engine.players if p.is_active])
-            if active > 1:
-                self.engine.deal_turn()
-                self.engine.game_state.advance_stage()
-                self.shark_stats['saw_turn_count'] += 1
-                self.current_hand['current_street'] = 'turn'
-                if not self._run_betting_round('turn'):
-                    self._check_winner(shark_start_chips)
-                    return True
-            
-            # 河牌圈
-            active = len([p for p in self.engine.players if p.is_active])
-            if active > 1:
-                self.engine.deal_river()
-                self.engine.game_state.advance_stage()
-                self.shark_stats['saw_river_count'] += 1
-                self.current_hand['current_street'] = 'river'
-                if not self._run_betting_round('river'):
-                    self._check_winner(shark_start_chips)
-                    return True
-            
-            # 摊牌
-            self._resolve_showdown(shark_start_chips)
-            return True
-            
-        except Exception as e:
+            return self._run_hand_inner(hand_num)
+        except Exception:
             return False
     
-    def _run_betting_round(self, street: str) -> bool:
+    def _run_hand_inner(self, hand_num: int) -> bool:
+        """运行一手牌（不捕获异常）"""
+        # 检查鲨鱼是否被淘汰
+        shark = self._shark
+        if not shark or shark.chips <= 0:
+            if not self.shark_stats['eliminated']:
+                self.shark_stats['eliminated'] = True
+                self.shark_stats['eliminated_at'] = hand_num
+            return False
+        
+        # 开始新一手
+        self.engine.start_new_hand()
+        self._hs_cache.clear()
+        self.shark_stats['hands_played'] += 1
+        
+        # DEBUG: 检查is_preflop_raiser重置
+        # print(f"  DEBUG: 新手牌开始，is_preflop_raiser={self.shark_ai.is_preflop_raiser}")
+        
+        # 检查盲注升级（每1000手翻倍）
+        new_level = (hand_num - 1) // self.hands_per_level + 1
+        if new_level > self.blind_level:
+            self.blind_level = new_level
+            multiplier = 2 ** (self.blind_level - 1)  # 2的(级别-1)次方
+            constants.SMALL_BLIND = self.base_small_blind * multiplier
+            constants.BIG_BLIND = self.base_big_blind * multiplier
+            print(f"  *** 盲注升级！第{self.blind_level}级: {constants.SMALL_BLIND}/{constants.BIG_BLIND} ***")
+        
+        # 每10手牌输出一次进度（用于调试卡顿问题）；静默时不输出，也不格式化
+        progress_out = self._progress_out
+        if progress_out is not None and hand_num % 10 == 0:
+            progress_out.write(f"  进度: 第{hand_num}手牌，鲨鱼筹码: {shark.chips}，盲注: {constants.SMALL_BLIND}/{constants.BIG_BLIND}\n")
+        
+        # 重置本手牌跟踪数据（确保每手牌只统计一次）
+        self.hand_vpip_recorded = False
+        self.hand_pfr_recorded = False
+        self.hand_3bet_recorded = False
+        self.hand_steal_recorded = False      # 偷盲每手牌只计一次
+        self.hand_cbet_recorded = False       # CBet机会每手牌只计一次
+        self.hand_bb_defend_recorded = False  # 大盲防守每手牌只计一次
+        self.shark_ai.is_preflop_raiser = False  # 重置翻牌前加注者标记
+        self.current_hand = {
+            'shark_position': self._get_shark_position(shark),
+            'shark_hand_rank': self._classify_hand(shark.hand.cards if shark.hand else []),
+            'preflop_raiser': False,
+            'current_street': 'preflop',
+            'pot_before_showdown': 0,
+        }
+        
+        # 记录手牌分类统计
+        hand_rank = self.current_hand['shark_hand_rank']
+        if hand_rank == 'premium':
+            self.shark_stats['premium_hands'] += 1
+        elif hand_rank == 'strong':
+            self.shark_stats['strong_hands'] += 1
+        elif hand_rank == 'playable':
+            self.shark_stats['playable_hands'] += 1
+        else:
+            self.shark_stats['weak_hands'] += 1
+        
+        # 记录位置统计
+        position = self.current_hand['shark_position']
+        self.shark_stats['hands_by_position'][position] += 1
+        
+        # 记录鲨鱼初始筹码
+        shark_start_chips = shark.chips if shark else 0
+        
+        # 运行翻牌前
+        if not self._run_betting_round(Street.PREFLOP):
+            self._check_winner(shark_start_chips)
+            return True
+        
+        # DEBUG: 检查翻牌前结束后的状态
+        # print(f"  DEBUG: 翻牌前结束，is_preflop_raiser={self.shark_ai.is_preflop_raiser}")
+        
+        # 翻牌圈（advance_stage 已同步活动玩家列表，直接取其长度）
+        game_state = self.engine.game_state
+        if game_state.get_active_player_count() <= 1:
+            self._award_uncontested()
+            return True
+        self.engine.deal_flop()
+        game_state.advance_stage()
+        self.shark_stats['saw_flop_count'] += 1
+        self.current_hand['current_street'] = 'flop'
+        if not self._run_betting_round(Street.FLOP):
+            self._check_winner(shark_start_chips)
+            return True
+        
+        # 转牌圈
+        if game_state.get_active_player_count() <= 1:
+            self._award_uncontested()
+            return True
+        self.engine.deal_turn()
+        game_state.advance_stage()
+        self.shark_stats['saw_turn_count'] += 1
+        self.current_hand['current_street'] = 'turn'
+        if not self._run_betting_round(Street.TURN):
+            self._check_winner(shark_start_chips)
+            return True
+        
+        # 河牌圈
+        if game_state.get_active_player_count() <= 1:
+            self._award_uncontested()
+            return True
+        self.engine.deal_river()
+        game_state.advance_stage()
+        self.shark_stats['saw_river_count'] += 1
+        self.current_hand['current_street'] = 'river'
+        if not self._run_betting_round(Street.RIVER):
+            self._check_winner(shark_start_chips)
+            return True
+        
+        # 摊牌（河牌圈后可能因强制弃牌只剩一人）
+        if game_state.get_active_player_count() <= 1:
+            self._award_uncontested()
+        else:
+            self._resolve_showdown()
+        return True
+    
+    def _run_betting_round(self, street: Street) -> bool:
         """运行下注轮"""
-        from texas_holdem.game.betting import BettingRound
-        from texas_holdem.utils.constants import Action
+        from texas_holdem.game.betting import BettingRound, RoundStatus
         import time
         
         game_state = self.engine.game_state
@@ -454,14 +503,17 @@ class SilentGameRunner:
         preflop_raise_happened = False
         facing_preflop_raise = False
         
+        # 下注轮是否结束：开局检查一次，之后由 process_action 返回的状态更新
+        round_over = game_state.is_betting_round_complete()
+        
         loop_count = 0
-        while not game_state.is_betting_round_complete() and action_count < max_actions:
+        while not round_over and action_count < max_actions:
             loop_count += 1
             
             # 超时检查：如果一轮下注超过10秒，强制退出
             elapsed = time.time() - start_time
             if elapsed > 10:
-                print(f"  警告：{street}轮次超时(10s)，强制结束")
+                print(f"  警告：{STREET_NAMES[street]}轮次超时(10s)，强制结束")
                 print(f"    行动次数: {action_count}, 循环次数: {loop_count}")
                 print(f"    当前玩家: {game_state.get_current_player()}")
                 print(f"    活动玩家: {len(game_state.get_active_players())}")
@@ -474,11 +526,11 @@ class SilentGameRunner:
             
             # 防止某个玩家无限决策（每100次循环检查一次）
             if loop_count % 100 == 0:
-                print(f"  警告：{street}轮次循环次数过多({loop_count})，当前玩家: {current_player.name}")
+                print(f"  警告：{STREET_NAMES[street]}轮次循环次数过多({loop_count})，当前玩家: {current_player.name}")
             
             # 在行动前检测是否面对加注（用于3bet统计）
-            shark = self._get_shark()
-            if shark and current_player.name == shark.name and street == 'preflop':
+            shark = self._shark
+            if shark and current_player is shark and street is Street.PREFLOP:
                 amount_to_call = betting_round.get_amount_to_call(current_player)
                 # 如果需要跟注超过20，说明有人加注了
                 if amount_to_call > 20:
@@ -491,29 +543,28 @@ class SilentGameRunner:
                 game_state.next_player()
                 continue
             
-            action_str = str(action).lower().replace('action.', '')
             amount_to_call = betting_round.get_amount_to_call(current_player)
             
             # 记录鲨鱼数据
-            if shark and current_player.name == shark.name:
+            if shark and current_player is shark:
                 position = self.current_hand['shark_position']
                 
                 # VPIP: 一手牌只计算一次（首次入池）
-                if street == 'preflop' and action_str in ['raise', 'call', 'bet'] and not self.hand_vpip_recorded:
+                if street is Street.PREFLOP and action in VPIP_ACTIONS and not self.hand_vpip_recorded:
                     self.shark_stats['vpip_count'] += 1
                     self.shark_stats['vpip_by_position'][position] += 1
                     self.hand_vpip_recorded = True
                 
                 # PFR: 一手牌只计算一次（首次加注）
-                if street == 'preflop' and action_str == 'raise' and not self.hand_pfr_recorded:
+                if street is Street.PREFLOP and action == Action.RAISE and not self.hand_pfr_recorded:
                     self.shark_stats['pfr_count'] += 1
                     self.shark_stats['pfr_by_position'][position] += 1
                     self.hand_pfr_recorded = True
                     self.current_hand['preflop_raiser'] = True
                 
                 # 3bet统计（翻牌前）- 修复：现在facing_preflop_raise在行动前已设置
-                if street == 'preflop':
-                    if action_str == 'raise':
+                if street is Street.PREFLOP:
+                    if action == Action.RAISE:
                         if facing_preflop_raise and not self.hand_3bet_recorded:
                             # 这是3bet
                             self.shark_stats['three_bet_count'] += 1
@@ -524,17 +575,17 @@ class SilentGameRunner:
                     
                     # 面对加注的统计（每手牌只统计一次机会）
                     if facing_preflop_raise and not self.hand_3bet_recorded:
-                        if action_str == 'fold':
+                        if action == Action.FOLD:
                             self.shark_stats['faced_3bet_count'] += 1
                             self.shark_stats['fold_to_3bet_count'] += 1
                             self.shark_stats['three_bet_opportunities'] += 1
                             self.hand_3bet_recorded = True  # 标记已统计
-                        elif action_str in ['call', 'bet']:
+                        elif action in (Action.CALL, Action.BET):
                             self.shark_stats['faced_3bet_count'] += 1
                             self.shark_stats['call_3bet_count'] += 1
                             self.shark_stats['three_bet_opportunities'] += 1
                             self.hand_3bet_recorded = True  # 标记已统计
-                        elif action_str == 'raise':
+                        elif action == Action.RAISE:
                             # 已经是3bet，上面统计过了
                             self.shark_stats['three_bet_opportunities'] += 1
                             self.hand_3bet_recorded = True  # 标记已统计
@@ -542,88 +593,88 @@ class SilentGameRunner:
                 # CBet统计（翻牌圈）
                 # 使用 shark_ai.is_preflop_raiser 来判断是否是翻牌前加注者
                     # CBet统计（翻牌圈）
-                if street == 'flop' and self.shark_ai.is_preflop_raiser and not self.hand_cbet_recorded:
+                if street is Street.FLOP and self.shark_ai.is_preflop_raiser and not self.hand_cbet_recorded:
                     self.hand_cbet_recorded = True
                     self.shark_stats['cbet_opportunities'] += 1
-                    if action_str in ['bet', 'raise']:
+                    if action in AGGRESSIVE_ACTIONS:
                         self.shark_stats['cbet_count'] += 1
                 
                 # 偷盲统计（CO/BTN/SB位置加注）
                 # 每手牌只计一次偷盲尝试
-                if street == 'preflop' and action_str == 'raise' and not self.hand_steal_recorded:
+                if street is Street.PREFLOP and action == Action.RAISE and not self.hand_steal_recorded:
                     if position in ['CO', 'BTN', 'SB']:
                         self.hand_steal_recorded = True
                         self.shark_stats['steal_attempts'] += 1
                 
                 # 大盲防守（每手牌只计一次）
-                if street == 'preflop' and position == 'BB' and action_str in ['call', 'raise'] and not self.hand_bb_defend_recorded:
+                if street is Street.PREFLOP and position == 'BB' and action in (Action.CALL, Action.RAISE) and not self.hand_bb_defend_recorded:
                     self.hand_bb_defend_recorded = True
                     self.shark_stats['bb_defend_count'] += 1
                 
                 # 弃牌统计
-                if action_str == 'fold':
+                if action == Action.FOLD:
                     self.shark_stats['folds'] += 1
-                    if street == 'flop':
+                    if street is Street.FLOP:
                         self.shark_stats['fold_flop_count'] += 1
-                    elif street == 'turn':
+                    elif street is Street.TURN:
                         self.shark_stats['fold_turn_count'] += 1
-                    elif street == 'river':
+                    elif street is Street.RIVER:
                         self.shark_stats['fold_river_count'] += 1
                 
                 # 跟注统计
-                if action_str == 'call':
+                if action == Action.CALL:
                     self.shark_stats['call_count'] += 1
                 
                 # All-in统计
-                if action_str == 'all_in':
+                if action == Action.ALL_IN:
                     self.shark_stats['all_in_count'] += 1
                 
                 # 下注大小统计
-                if action_str == 'bet' and amount > 0:
+                if action == Action.BET and amount > 0:
                     self.shark_stats['total_bets'] += 1
                     self.shark_stats['total_bet_amount'] += amount
-                if action_str == 'raise' and amount > 0:
+                if action == Action.RAISE and amount > 0:
                     self.shark_stats['total_raises'] += 1
                     self.shark_stats['total_raise_amount'] += amount
                 
                 # 各街行动统计
-                if street == 'flop':
-                    if action_str == 'bet':
+                if street is Street.FLOP:
+                    if action == Action.BET:
                         self.shark_stats['flop_bets'] += 1
-                    elif action_str == 'raise':
+                    elif action == Action.RAISE:
                         self.shark_stats['flop_raises'] += 1
-                    elif action_str == 'call':
+                    elif action == Action.CALL:
                         self.shark_stats['flop_calls'] += 1
-                    elif action_str == 'fold':
+                    elif action == Action.FOLD:
                         self.shark_stats['flop_folds'] += 1
-                elif street == 'turn':
-                    if action_str == 'bet':
+                elif street is Street.TURN:
+                    if action == Action.BET:
                         self.shark_stats['turn_bets'] += 1
-                    elif action_str == 'raise':
+                    elif action == Action.RAISE:
                         self.shark_stats['turn_raises'] += 1
-                    elif action_str == 'call':
+                    elif action == Action.CALL:
                         self.shark_stats['turn_calls'] += 1
-                    elif action_str == 'fold':
+                    elif action == Action.FOLD:
                         self.shark_stats['turn_folds'] += 1
-                elif street == 'river':
-                    if action_str == 'bet':
+                elif street is Street.RIVER:
+                    if action == Action.BET:
                         self.shark_stats['river_bets'] += 1
-                    elif action_str == 'raise':
+                    elif action == Action.RAISE:
                         self.shark_stats['river_raises'] += 1
-                    elif action_str == 'call':
+                    elif action == Action.CALL:
                         self.shark_stats['river_calls'] += 1
-                    elif action_str == 'fold':
+                    elif action == Action.FOLD:
                         self.shark_stats['river_folds'] += 1
             
             # 更新鲨鱼AI追踪
             if current_player.ai_style != 'SHARK':
                 self.shark_ai.update_after_action(
-                    current_player.name, action_str, street
+                    current_player.idx, action, STREET_NAMES[street]
                 )
             
             # 执行行动
-            success, msg, bet_amount = betting_round.process_action(current_player, action, amount)
-            if not success:
+            status, msg, bet_amount = betting_round.process_action(current_player, action, amount)
+            if status is RoundStatus.INVALID:
                 game_state.next_player()
                 continue
             
@@ -632,22 +683,19 @@ class SilentGameRunner:
             # 移动到下一个玩家
             game_state.next_player()
             
-            # 更新活动玩家列表（因为可能有玩家弃牌）
-            game_state.update_active_players()
-            
             # 检查是否只剩一个玩家
-            active_players = game_state.get_active_players()
-            if len(active_players) <= 1:
+            if status is RoundStatus.HAND_OVER:
                 # CBet成功：如果鲨鱼下注/加注后只剩一个玩家
-                if shark and current_player.name == shark.name:
-                    if street == 'flop' and self.current_hand['preflop_raiser']:
-                        if action_str in ['bet', 'raise']:
+                if shark and current_player is shark:
+                    if street is Street.FLOP and self.current_hand['preflop_raiser']:
+                        if action in AGGRESSIVE_ACTIONS:
                             self.shark_stats['cbet_success_count'] += 1
                     # 偷盲成功
-                    if street == 'preflop' and self.current_hand['shark_position'] in ['CO', 'BTN', 'SB']:
-                        if action_str in ['raise', 'bet', 'all_in']:
+                    if street is Street.PREFLOP and self.current_hand['shark_position'] in ['CO', 'BTN', 'SB']:
+                        if action in (Action.RAISE, Action.BET, Action.ALL_IN):
                             self.shark_stats['steal_success'] += 1
                 return False
+            round_over = status is RoundStatus.ROUND_OVER
         
         # 安全检查：如果达到最大行动次数，强制结束
         if action_count >= max_actions:
@@ -660,93 +708,88 @@ class SilentGameRunner:
     
     def _check_winner(self, shark_start_chips: int):
         """检查赢家（不摊牌）"""
-        shark = self._get_shark()
+        shark = self._shark
         if not shark:
             return
         
         active = [p for p in self.engine.players if p.is_active]
-        if len(active) == 1 and active[0].name == shark.name:
-            self.shark_stats['hands_won'] += 1
-            self.shark_stats['wins_without_showdown'] += 1
-            
-            # 底池统计
-            pot_size = self.engine.game_state.table.total_pot
-            self.shark_stats['total_pots_won'] += 1
-            self.shark_stats['avg_pot_won'] = (self.shark_stats['avg_pot_won'] * (self.shark_stats['total_pots_won'] - 1) + pot_size) / self.shark_stats['total_pots_won']
-            if pot_size > self.shark_stats['largest_pot_won']:
-                self.shark_stats['largest_pot_won'] = pot_size
-            
-            # All-in获胜统计
-            if shark.chips <= 0:  # All-in且获胜
-                self.shark_stats['all_in_wins'] += 1
-            
-            # 手牌胜率统计
-            hand_rank = self.current_hand['shark_hand_rank']
-            if hand_rank == 'premium':
-                self.shark_stats['premium_win_rate'] += 1
-            elif hand_rank == 'strong':
-                self.shark_stats['strong_win_rate'] += 1
-            elif hand_rank == 'playable':
-                self.shark_stats['playable_win_rate'] += 1
-            else:
-                self.shark_stats['weak_win_rate'] += 1
+        if len(active) == 1 and active[0] is shark:
+            self._record_win_without_showdown(self.engine.game_state.table.total_pot)
     
-    def _resolve_showdown(self, shark_start_chips: int):
-        """摊牌结算"""
-        from texas_holdem.core.evaluator import PokerEvaluator
+    def _award_uncontested(self):
+        """无人争夺的底池直接判给唯一剩余玩家，不经过牌力评估"""
+        active_players = [p for p in self.engine.players if p.is_active]
+        if len(active_players) != 1:
+            return
         
+        winner = active_players[0]
+        win_amount = self.engine.game_state.table.total_pot
+        if winner is self._shark:
+            # 先统计再加筹码，All-in判定需要获胜前的筹码
+            self._record_win_without_showdown(win_amount)
+        winner.chips += win_amount
+    
+    def _record_win_without_showdown(self, pot_size: int):
+        """记录鲨鱼不摊牌赢下底池的统计"""
+        shark = self._shark
+        self.shark_stats['hands_won'] += 1
+        self.shark_stats['wins_without_showdown'] += 1
+        
+        # 底池统计
+        self.shark_stats['total_pots_won'] += 1
+        self.shark_stats['avg_pot_won'] = (self.shark_stats['avg_pot_won'] * (self.shark_stats['total_pots_won'] - 1) + pot_size) / self.shark_stats['total_pots_won']
+        if pot_size > self.shark_stats['largest_pot_won']:
+            self.shark_stats['largest_pot_won'] = pot_size
+        
+        # All-in获胜统计
+        if shark.chips <= 0:  # All-in且获胜
+            self.shark_stats['all_in_wins'] += 1
+        
+        # 手牌胜率统计
+        hand_rank = self.current_hand['shark_hand_rank']
+        if hand_rank == 'premium':
+            self.shark_stats['premium_win_rate'] += 1
+        elif hand_rank == 'strong':
+            self.shark_stats['strong_win_rate'] += 1
+        elif hand_rank == 'playable':
+            self.shark_stats['playable_win_rate'] += 1
+        else:
+            self.shark_stats['weak_win_rate'] += 1
+    
+    def _resolve_showdown(self):
+        """摊牌结算"""
         game_state = self.engine.game_state
         active_players = [p for p in self.engine.players if p.is_active]
         
-        if len(active_players) == 0:
+        if len(active_players) < 2:
+            self._award_uncontested()
             return
         
-        shark = self._get_shark()
-        
-        if len(active_players) == 1:
-            winner = active_players[0]
-            win_amount = game_state.table.total_pot
-            winner.chips += win_amount
-            
-            if shark and winner.name == shark.name:
-                self.shark_stats['hands_won'] += 1
-                self.shark_stats['wins_without_showdown'] += 1
-                
-                # 底池统计
-                self.shark_stats['total_pots_won'] += 1
-                self.shark_stats['avg_pot_won'] = (self.shark_stats['avg_pot_won'] * (self.shark_stats['total_pots_won'] - 1) + win_amount) / self.shark_stats['total_pots_won']
-                if win_amount > self.shark_stats['largest_pot_won']:
-                    self.shark_stats['largest_pot_won'] = win_amount
-            return
+        from texas_holdem.core.evaluator import PokerEvaluator
+        shark = self._shark
         
         # 比较牌力
         community_cards = game_state.table.community_cards
         if len(community_cards) < 5:
             return
         
-        best_rank = float('inf')
+        # 一次性批量评估所有摊牌玩家，分值越大牌力越强（含踢脚比较）
+        contenders = [p for p in active_players if p.hand and len(p.hand.cards) == 2]
+        scores = PokerEvaluator.evaluate_hands_batch(
+            [p.hand.cards for p in contenders], community_cards
+        )
         winners = []
-        
-        for player in active_players:
-            if player.hand and len(player.hand.cards) == 2:
-                all_cards = player.hand.cards + community_cards
-                try:
-                    rank, values = PokerEvaluator.evaluate_hand(all_cards)
-                    if rank < best_rank:
-                        best_rank = rank
-                        winners = [player]
-                    elif rank == best_rank:
-                        winners.append(player)
-                except:
-                    continue
-        
+        if scores:
+            best_score = max(scores)
+            winners = [p for p, score in zip(contenders, scores) if score == best_score]
+
         # 分配底池
         if winners:
             win_amount = game_state.table.total_pot // len(winners)
             for winner in winners:
                 winner.chips += win_amount
                 
-                if shark and winner.name == shark.name:
+                if shark and winner is shark:
                     self.shark_stats['hands_won'] += 1
                     self.shark_stats['showdown_wins'] += 1
                     self.shark_stats['showdowns'] += 1
@@ -767,7 +810,7 @@ class SilentGameRunner:
                         self.shark_stats['playable_win_rate'] += 1
                     else:
                         self.shark_stats['weak_win_rate'] += 1
-                elif shark and winner.name != shark.name and shark in active_players:
+                elif shark and winner is not shark and shark in active_players:
                     self.shark_stats['showdown_losses'] += 1
                     self.shark_stats['showdowns'] += 1
     
@@ -778,7 +821,7 @@ class SilentGameRunner:
         Returns:
             (是否结束, 结果类型) 结果类型: 'eliminated', 'victory', 'ongoing'
         """
-        shark = self._get_shark()
+        shark = self._shark
         
         # 鲨鱼被淘汰
         if not shark or shark.chips <= 0:
@@ -786,7 +829,7 @@ class SilentGameRunner:
         
         # 检查是否只剩鲨鱼AI一个玩家有筹码
         active_with_chips = [p for p in self.engine.players if p.chips > 0]
-        if len(active_with_chips) == 1 and active_with_chips[0].name == shark.name:
+        if len(active_with_chips) == 1 and active_with_chips[0] is shark:
             return True, 'victory'
         
         return False, 'ongoing'
@@ -803,17 +846,14 @@ class SilentGameRunner:
         
         self.setup_game()
         
-        # 使用StringIO抑制输出
-        f = io.StringIO()
+        # 丢弃对局过程中的输出，进度信息由 run_hand 直接写到真实的标准输出
+        self._progress_out = sys.stdout
         hand_num = 0
         
-        with redirect_stdout(f):
+        with redirect_stdout(_NullIO()):
             while hand_num < self.max_hands:
                 hand_num += 1
                 
-                if hand_num % 10 == 0:
-                    print(f"  进度: {hand_num}手牌")
-                
                 # 先检查游戏是否已经结束
                 is_over, result = self._check_game_over()
                 if is_over:
@@ -851,19 +891,24 @@ class SilentGameRunner:
     
     def _calculate_final_results(self):
         """计算最终结果"""
-        shark = self._get_shark()
+        shark = self._shark
         if shark:
             self.shark_stats['final_chips'] = shark.chips
             self.shark_stats['profit'] = shark.chips - self.shark_start_chips
         
-        # 计算排名
-        all_players = [(p.name, p.chips) for p in self.engine.players]
-        all_players.sort(key=lambda x: x[1], reverse=True)
-        
-        for rank, (name, chips) in enumerate(all_players, 1):
-            if '鲨鱼' in name or 'SHARK' in name:
+        # 计算排名：一次遍历统计筹码更多的玩家（筹码相同时座位靠前者排前）
+        if shark:
+            shark_chips = shark.chips
+            rank = 1
+            seated_before = True
+            for p in self.engine.players:
+                if p is shark:
+                    seated_before = False
+                elif p.chips > shark_chips or (seated_before and p.chips == shark_chips):
+                    rank += 1
+            # 鲨鱼已被移出玩家列表（淘汰）时保持原值
+            if not seated_before:
                 self.shark_stats['final_rank'] = rank
-                break
         
         # 计算VPIP/PFR
         if self.shark_stats['hands_played'] > 0:
@@ -964,7 +1009,6 @@ class SilentGameRunner:
             output_file: 输出文件路径，如果指定则写入文件，否则打印到控制台
         """
         import os
-        import texas_holdem.utils.constants as constants
         
         s = self.shark_stats
         hands = s['hands_played']
@@ -1092,8 +1136,44 @@ class SilentGameRunner:
             print(report_text)
 
 
+# 当前进程复用的测试运行器（由 _run_one 惰性创建）
+_worker_runner = None
+
+
+def _run_one(args) -> tuple:
+    """
+    运行单轮测试（在工作进程中执行）
+    
+    Args:
+        args: (轮次编号, 最大手牌数, 报告目录)
+    
+    Returns:
+        (统计结果, 本轮控制台输出)
+    """
+    test_num, max_hands, result_dir = args
+    import os
+    
+    global _worker_runner
+    
+    output = io.StringIO()
+    with redirect_stdout(output):
+        # 同一进程内复用运行器，只重置每轮的统计状态
+        if _worker_runner is None:
+            _worker_runner = SilentGameRunner(max_hands=max_hands)
+        else:
+            _worker_runner.reset(max_hands)
+        runner = _worker_runner
+        result = runner.run_benchmark()
+        
+        # 保存本轮报告到文件
+        report_file = os.path.join(result_dir, f"shark_report_{test_num:03d}.txt")
+        runner.print_report(output_file=report_file)
+    
+    return result, output.getvalue()
+
+
 def run_multiple_benchmarks(num_tests: int = 3, max_hands_per_test: int = 10000, 
-                           output_dir: str = "benchmark_results"):
+                           output_dir: str = "benchmark_results", processes: int = None):
     """
     运行多次测试取平均
     每轮测试直到鲨鱼AI被淘汰或胜出
@@ -1102,9 +1182,11 @@ def run_multiple_benchmarks(num_tests: int = 3, max_hands_per_test: int = 10000,
         num_tests: 测试轮数
         max_hands_per_test: 每轮最大手牌数（防止无限循环）
         output_dir: 报告输出目录
+        processes: 并行进程数，默认 min(轮数, CPU核数)，为1时在当前进程顺序运行
     """
     import os
     import datetime
+    import multiprocessing
     
     # 创建输出目录
     os.makedirs(output_dir, exist_ok=True)
@@ -1114,52 +1196,62 @@ def run_multiple_benchmarks(num_tests: int = 3, max_hands_per_test: int = 10000,
     result_dir = os.path.join(output_dir, f"shark_benchmark_{timestamp}")
     os.makedirs(result_dir, exist_ok=True)
     
+    if processes is None:
+        processes = min(num_tests, os.cpu_count() or 1)
+    
     print(f"\n{'#'*60}")
     print(f"#  鲨鱼AI强度测试 - {num_tests}轮 (直到淘汰或胜出)")
     print(f"#  盲注: 10/20 (每1000手翻倍)")
     print(f"#  每轮上限: {max_hands_per_test}手")
+    print(f"#  并行进程: {processes}")
     print(f"#  报告目录: {result_dir}")
     print(f"{'#'*60}\n")
     
     all_results = []
     victories = 0
     eliminations = 0
+    totals = [0] * len(SUMMARY_FIELDS)
     
-    for test_num in range(1, num_tests + 1):
-        print(f"\n{'#'*60}")
-        print(f"#  第 {test_num}/{num_tests} 轮测试")
-        print(f"{'#'*60}")
-        
-        runner = SilentGameRunner(max_hands=max_hands_per_test)
-        result = runner.run_benchmark()
-        
-        # 保存本轮报告到文件
-        report_file = os.path.join(result_dir, f"shark_report_{test_num:03d}.txt")
-        runner.print_report(output_file=report_file)
-        
-        all_results.append(result)
-        
-        # 统计胜率和淘汰率
-        if result.get('victory'):
-            victories += 1
-        if result.get('eliminated'):
-            eliminations += 1
+    tasks = [(test_num, max_hands_per_test, result_dir) for test_num in range(1, num_tests + 1)]
+    pool = None
+    if processes > 1:
+        # fork 出的进程继承了父进程的随机状态，需重新播种以免各轮结果相同
+        pool = multiprocessing.Pool(processes=processes, initializer=random.seed)
+        outputs = pool.imap(_run_one, tasks)
+    else:
+        outputs = map(_run_one, tasks)
+    
+    try:
+        # 各轮输出按轮次顺序打印，互不交错
+        for test_num, (result, output) in enumerate(outputs, 1):
+            print(f"\n{'#'*60}")
+            print(f"#  第 {test_num}/{num_tests} 轮测试")
+            print(f"{'#'*60}")
+            print(output, end='')
+            
+            all_results.append(result)
+            
+            # 汇总字段在同一次遍历中累加
+            for i, field in enumerate(SUMMARY_FIELDS):
+                totals[i] += result.get(field, 0)
+            
+            # 统计胜率和淘汰率
+            if result.get('victory'):
+                victories += 1
+            if result.get('eliminated'):
+                eliminations += 1
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
     
     # 汇总
     print(f"\n{'#'*60}")
     print(f"#  汇总报告 ({num_tests}轮测试)")
     print(f"{'#'*60}\n")
     
-    avg_hands = sum(r['hands_played'] for r in all_results) / num_tests
-    avg_profit = sum(r['profit'] for r in all_results) / num_tests
-    avg_wins = sum(r['hands_won'] for r in all_results) / num_tests
-    avg_vpip = sum(r.get('vpip', 0) for r in all_results) / num_tests
-    avg_pfr = sum(r.get('pfr', 0) for r in all_results) / num_tests
-    avg_3bet = sum(r.get('three_bet_pct', 0) for r in all_results) / num_tests
-    avg_cbet = sum(r.get('cbet_pct', 0) for r in all_results) / num_tests
-    avg_fold_to_3bet = sum(r.get('fold_to_3bet_pct', 0) for r in all_results) / num_tests
-    
-    avg_rank = sum(r['final_rank'] for r in all_results) / num_tests
+    (avg_hands, avg_profit, avg_wins, avg_vpip, avg_pfr,
+     avg_3bet, avg_cbet, avg_fold_to_3bet, avg_rank) = [total / num_tests for total in totals]
     
     # 构建汇总报告
     summary_lines = []
@@ -46,6 +46,8 @@ def _supports_ansi():
 
 
 class Card:
+    __slots__ = ('suit', 'rank', 'value', 'suit_index', 'rank_bit', 'card_id', 'encoded')
+
     # 花色映射（使用ASCII字符避免编码问题）
     SUITS = {
         'H': 'H',  # 红桃
@@ -93,6 +95,11 @@ class Card:
         'J': 11, 'Q': 12, 'K': 13, 'A': 14
     }
 
+    # 花色索引（用于位掩码表示）
+    SUIT_INDEX = {'H': 0, 'D': 1, 'C': 2, 'S': 3}
+    # 花色索引反向映射（按 SUIT_INDEX 顺序）
+    SUIT_BY_INDEX = ('H', 'D', 'C', 'S')
+
     # 反向映射用于显示
     RANK_TO_STR = {
         2: '2', 3: '3', 4: '4', 5: '5', 6: '6', 7: '7', 8: '8', 9: '9', 10: '10',
@@ -115,6 +122,13 @@ class Card:
         self.suit = suit
         self.rank = rank
         self.value = self.RANKS[rank]
+        # 位掩码表示：13位牌面掩码中的一位（2 -> bit0, A -> bit12）
+        self.suit_index = self.SUIT_INDEX[suit]
+        self.rank_bit = 1 << (self.value - 2)
+        # 整副牌中的唯一编号 0-51（花色索引*13 + 牌面位）
+        self.card_id = self.suit_index * 13 + self.value - 2
+        # 整数编码：52位牌掩码中的一位，多张牌按位或即得到 evaluate_mask 的输入
+        self.encoded = 1 << self.card_id
 
     def __repr__(self):
         return f"Card('{self.suit}', '{self.rank}')"
@@ -186,3 +200,10 @@ class Card:
     def from_dict(cls, data):
         """从字典创建Card对象"""
         return cls(data['suit'], data['rank'])
+
+    @classmethod
+    def from_id(cls, card_id: int):
+        """从整副牌中的编号(0-51，即 card_id)创建Card对象"""
+        if not 0 <= card_id < 52:
+            raise ValueError(f"Invalid card id: {card_id}. Must be in range 0-51")
+        return cls(cls.SUIT_BY_INDEX[card_id // 13], cls.RANK_TO_STR[card_id % 13 + 2])
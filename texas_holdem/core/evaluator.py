@@ -7,6 +7,38 @@ import itertools
 from typing import List, Tuple, Dict, Optional
 from .card import Card
 
+# 顺子图案（13位牌面掩码，bit = 牌面值-2）及其最大牌，从大到小排列，最后是A-2-3-4-5
+_STRAIGHT_PATTERNS = tuple((0x1F << i, i + 6) for i in range(8, -1, -1)) + ((0x100F, 5),)
+
+
+def _straight_high(rank_mask: int) -> int:
+    """返回牌面掩码中最大顺子的最大牌，没有顺子返回0"""
+    for pattern, high in _STRAIGHT_PATTERNS:
+        if rank_mask & pattern == pattern:
+            return high
+    return 0
+
+
+def _top_values(rank_mask: int, n: int) -> List[int]:
+    """从牌面掩码中按从大到小取出n个牌面值"""
+    values = []
+    while rank_mask and len(values) < n:
+        bit = rank_mask.bit_length() - 1
+        values.append(bit + 2)
+        rank_mask ^= 1 << bit
+    return values
+
+
+def _decode_score(score: int) -> Tuple[int, List[int]]:
+    """把 evaluate_mask 的分值还原为 evaluate_hand 的 (hand_rank, rank_values) 形式"""
+    values = []
+    for shift in (16, 12, 8, 4, 0):
+        value = (score >> shift) & 0xF
+        if value:
+            values.append(value)
+    return score >> 20, values
+
+
 class PokerEvaluator:
     """德州扑克手牌评估器"""
 
@@ -52,6 +84,12 @@ class PokerEvaluator:
         if len(cards) < 5:
             raise ValueError(f"Need at least 5 cards, got {len(cards)}")
 
+        # 快速路径：5-7张不重复的牌直接走位运算评估，结果与组合枚举完全一致
+        if len(cards) <= 7:
+            card_mask = PokerEvaluator.cards_to_mask(cards)
+            if bin(card_mask).count('1') == len(cards):
+                return _decode_score(PokerEvaluator.evaluate_mask(card_mask))
+
         # 生成所有5张牌的组合
         best_rank = -1
         best_rank_values = []
@@ -199,6 +237,97 @@ class PokerEvaluator:
                     return -1
             return 0
 
+    @staticmethod
+    def evaluate_mask(card_mask: int) -> int:
+        """
+        评估52位牌掩码（card_id = 花色索引*13 + 牌面值-2）表示的5-7张牌
+
+        与 evaluate_hand 结果顺序一致，但直接用位运算求最佳牌型，
+        不枚举5张牌组合，适合大量蒙特卡洛模拟。
+
+        Returns:
+            可直接比较大小的整数分值：hand_rank << 20 | 比较牌面值（每个4位）
+        """
+        s0 = card_mask & 0x1FFF
+        s1 = (card_mask >> 13) & 0x1FFF
+        s2 = (card_mask >> 26) & 0x1FFF
+        s3 = (card_mask >> 39) & 0x1FFF
+
+        # 同花（7张牌内出现同花时不可能再有四条或葫芦）
+        for suited in (s0, s1, s2, s3):
+            if bin(suited).count('1') >= 5:
+                high = _straight_high(suited)
+                if high == 14:
+                    rank, values = PokerEvaluator.ROYAL_FLUSH, [14]
+                elif high:
+                    rank, values = PokerEvaluator.STRAIGHT_FLUSH, [high]
+                else:
+                    rank, values = PokerEvaluator.FLUSH, _top_values(suited, 5)
+                break
+        else:
+            # 至少出现1/2/3/4次的牌面掩码
+            any_mask = s0 | s1 | s2 | s3
+            two = (s0 & s1) | (s0 & s2) | (s0 & s3) | (s1 & s2) | (s1 & s3) | (s2 & s3)
+            three = (s0 & s1 & s2) | (s0 & s1 & s3) | (s0 & s2 & s3) | (s1 & s2 & s3)
+            four = s0 & s1 & s2 & s3
+
+            if four:
+                quad = four.bit_length() - 1
+                rest = any_mask & ~(1 << quad)
+                rank, values = PokerEvaluator.FOUR_OF_A_KIND, [quad + 2] + _top_values(rest, 1)
+            elif three and two & ~(1 << (three.bit_length() - 1)):
+                trip = three.bit_length() - 1
+                pair = (two & ~(1 << trip)).bit_length() - 1
+                rank, values = PokerEvaluator.FULL_HOUSE, [trip + 2, pair + 2]
+            else:
+                high = _straight_high(any_mask)
+                if high:
+                    rank, values = PokerEvaluator.STRAIGHT, [high]
+                elif three:
+                    trip = three.bit_length() - 1
+                    rank, values = (PokerEvaluator.THREE_OF_A_KIND,
+                                    [trip + 2] + _top_values(any_mask & ~(1 << trip), 2))
+                elif two:
+                    pairs = _top_values(two, 2)
+                    if len(pairs) == 2:
+                        rest = any_mask & ~(1 << (pairs[0] - 2)) & ~(1 << (pairs[1] - 2))
+                        rank, values = PokerEvaluator.TWO_PAIR, pairs + _top_values(rest, 1)
+                    else:
+                        rest = any_mask & ~(1 << (pairs[0] - 2))
+                        rank, values = PokerEvaluator.ONE_PAIR, pairs + _top_values(rest, 3)
+                else:
+                    rank, values = PokerEvaluator.HIGH_CARD, _top_values(any_mask, 5)
+
+        score = rank
+        for i in range(5):
+            score = (score << 4) | (values[i] if i < len(values) else 0)
+        return score
+
+    @staticmethod
+    def cards_to_mask(cards: List[Card]) -> int:
+        """把卡牌列表转换为 evaluate_mask 使用的52位牌掩码"""
+        card_mask = 0
+        for card in cards:
+            card_mask |= card.encoded
+        return card_mask
+
+    @staticmethod
+    def evaluate_hands_batch(hands: List[List[Card]], board_cards: List[Card] = ()) -> List[int]:
+        """
+        批量评估多手5-7张牌（如摊牌时所有玩家的底牌+公共牌）
+
+        Args:
+            hands: 每个元素为一手牌的卡牌列表
+            board_cards: 所有手牌共用的公共牌，只编码一次后并入每手牌
+
+        Returns:
+            与 hands 一一对应的 evaluate_mask 分值，分值越大牌力越强
+        """
+        evaluate_mask = PokerEvaluator.evaluate_mask
+        cards_to_mask = PokerEvaluator.cards_to_mask
+        board_mask = cards_to_mask(board_cards)
+        return [evaluate_mask(board_mask | cards_to_mask(cards)) for cards in hands]
+
     @staticmethod
     def get_hand_name(hand_rank: int) -> str:
         """获取手牌等级名称"""
@@ -27,6 +27,8 @@ class Player:
         self.is_small_blind = False  # 是否为小盲
         self.is_big_blind = False  # 是否为大盲
         self.is_ai = is_ai  # 是否为AI玩家
+        self.ai_style = ''  # AI风格（TAG/LAG/SHARK等，人类玩家为空）
+        self.idx = -1  # 座位下标（由游戏引擎分配，-1 表示未入座）
 
     def reset_for_new_hand(self):
         """为新的一手牌重置玩家状态"""
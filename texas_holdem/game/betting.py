@@ -3,11 +3,21 @@
 管理德州扑克的下注轮次和行动验证
 """
 
+from enum import IntEnum
 from typing import List, Tuple, Optional
 from ..core.player import Player
 from .game_state import GameStateManager
 from ..utils.constants import Action
 
+
+class RoundStatus(IntEnum):
+    """玩家行动后的下注轮状态"""
+    INVALID = 0     # 行动无效，未执行
+    CONTINUE = 1    # 下注轮继续
+    ROUND_OVER = 2  # 本轮下注结束
+    HAND_OVER = 3   # 只剩一名玩家，本手牌结束
+
+
 class BettingRound:
     def __init__(self, game_state: GameStateManager):
         """
@@ -90,15 +100,36 @@ class BettingRound:
 
         return False, f"未知行动: {action}"
 
-    def process_action(self, player: Player, action: str, amount: int = 0) -> Tuple[bool, str, int]:
+    def process_action(self, player: Player, action: str, amount: int = 0) -> Tuple[RoundStatus, str, int]:
         """
-        处理玩家行动
+        处理玩家行动，并判断行动后的下注轮状态
 
         Args:
             player: 执行行动的玩家
             action: 行动类型
             amount: 下注/加注金额
 
+        Returns:
+            (行动后状态, 消息, 实际下注金额)
+            行动失败时状态为 RoundStatus.INVALID（布尔值为假，可直接当作“是否成功”判断）
+        """
+        success, message, actual_amount = self._apply_action(player, action, amount)
+        if not success:
+            return RoundStatus.INVALID, message, actual_amount
+
+        game_state = self.game_state
+        if len(game_state.active_players) <= 1:
+            status = RoundStatus.HAND_OVER
+        elif game_state.is_betting_round_complete():
+            status = RoundStatus.ROUND_OVER
+        else:
+            status = RoundStatus.CONTINUE
+        return status, message, actual_amount
+
+    def _apply_action(self, player: Player, action: str, amount: int = 0) -> Tuple[bool, str, int]:
+        """
+        执行玩家行动（修改玩家与游戏状态）
+
         Returns:
             (是否成功, 消息, 实际下注金额)
         """
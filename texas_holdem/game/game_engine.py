@@ -27,6 +27,8 @@ class GameEngine:
             raise ValueError("目前支持2-8人游戏")
 
         self.players = [Player(name, initial_chips) for name in player_names]
+        for i, player in enumerate(self.players):
+            player.idx = i
         self.game_state = GameStateManager(self.players)
         self.deck = Deck()
         self.betting_round = BettingRound(self.game_state)
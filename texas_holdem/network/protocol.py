@@ -72,14 +72,23 @@ class GameMessage:
 
 # 游戏状态序列化/反序列化辅助函数
 
+def encode_card_for_network(card) -> Optional[Dict[str, Any]]:
+    """编码扑克牌为网络传输格式"""
+    if card is None:
+        return None
+    return {
+        'suit': card.suit,
+        'rank': card.rank,
+        'value': card.value
+    }
+
+
 def encode_game_state_for_network(game_state, players, current_player_name: str, 
                                    timeout: int = 15) -> Dict[str, Any]:
     """
     将游戏状态编码为网络传输格式
     注意：手牌信息会根据玩家分别发送
     """
-    from ..utils.save_manager import GameStateEncoder
-    
     # 基础游戏状态
     state_data = {
         'state': game_state.state,
@@ -93,7 +102,7 @@ def encode_game_state_for_network(game_state, players, current_player_name: str,
     
     # 公共牌
     state_data['community_cards'] = [
-        GameStateEncoder.encode_card(c) for c in game_state.table.get_community_cards()
+        encode_card_for_network(c) for c in game_state.table.get_community_cards()
     ]
     
     # 底池信息
@@ -129,8 +138,7 @@ def decode_game_state_from_network(state_data: Dict[str, Any]) -> Dict[str, Any]
 
 def encode_player_hand(player) -> Dict[str, Any]:
     """编码玩家手牌（只发给对应玩家）"""
-    from ..utils.save_manager import GameStateEncoder
     return {
         'name': player.name,
-        'hand': GameStateEncoder.encode_hand(player.hand)
+        'hand': [encode_card_for_network(c) for c in player.hand.get_cards()]
     }
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+下注轮测试
+直接调用 BettingRound.process_action，验证行动后返回的下注轮状态
+"""
+
+import io
+import os
+import sys
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from texas_holdem.game.game_engine import GameEngine
+from texas_holdem.game.betting import BettingRound, RoundStatus
+from texas_holdem.utils.constants import Action
+
+
+def _new_round():
+    """创建三人牌局并开始一手牌，返回 (游戏状态, 下注轮)"""
+    engine = GameEngine(['A', 'B', 'C'])
+    with redirect_stdout(io.StringIO()):
+        engine.start_new_hand()
+    game_state = engine.game_state
+    # 与 GameEngine.run_betting_round 一致：下注轮开始前重置行动状态（大盲保留行动权）
+    game_state.reset_player_actions()
+    return game_state, BettingRound(game_state)
+
+
+def _act(game_state, betting_round, action, amount=0):
+    """当前玩家执行行动，成功时轮到下一名玩家，返回行动后的状态"""
+    player = game_state.get_current_player()
+    status, _, _ = betting_round.process_action(player, action, amount)
+    if status:
+        game_state.next_player()
+    return status
+
+
+def test_invalid_action():
+    """测试：需要跟注时过牌无效，状态为 INVALID 且不改变行动玩家"""
+    print("=" * 50)
+    print("测试: 无效行动")
+    print("=" * 50)
+
+    game_state, betting_round = _new_round()
+    player = game_state.get_current_player()
+    status = _act(game_state, betting_round, Action.CHECK)
+
+    if status is RoundStatus.INVALID and not status and game_state.get_current_player() is player:
+        print("[PASS] 过牌被拒绝，仍由同一玩家行动")
+        return True
+    print(f"[FAIL] 状态: {status!r}")
+    return False
+
+
+def test_round_continue_and_over():
+    """测试：翻牌前跟注时下注轮继续，大盲过牌后本轮结束"""
+    print("=" * 50)
+    print("测试: 下注轮继续与结束")
+    print("=" * 50)
+
+    game_state, betting_round = _new_round()
+    statuses = [
+        _act(game_state, betting_round, Action.CALL),   # 庄家跟注
+        _act(game_state, betting_round, Action.CALL),   # 小盲补齐
+        _act(game_state, betting_round, Action.CHECK),  # 大盲行使过牌权
+    ]
+
+    expected = [RoundStatus.CONTINUE, RoundStatus.CONTINUE, RoundStatus.ROUND_OVER]
+    if statuses == expected and game_state.get_active_player_count() == 3:
+        print("[PASS] 大盲行动前下注轮继续，行动后本轮结束")
+        return True
+    print(f"[FAIL] 状态序列: {statuses}")
+    return False
+
+
+def test_fold_to_one_player():
+    """测试：弃牌后只剩一名玩家时状态为 HAND_OVER，活动玩家列表同步更新"""
+    print("=" * 50)
+    print("测试: 弃牌只剩一名玩家")
+    print("=" * 50)
+
+    game_state, betting_round = _new_round()
+    statuses = [
+        _act(game_state, betting_round, Action.FOLD),
+        _act(game_state, betting_round, Action.FOLD),
+    ]
+
+    expected = [RoundStatus.CONTINUE, RoundStatus.HAND_OVER]
+    active = game_state.active_players
+    if statuses == expected and len(active) == 1 and active[0].is_big_blind:
+        print("[PASS] 两人弃牌后本手牌结束，大盲成为唯一活动玩家")
+        return True
+    print(f"[FAIL] 状态序列: {statuses}, 活动玩家: {[p.name for p in active]}")
+    return False
+
+
+if __name__ == "__main__":
+    tests = [
+        ("无效行动", test_invalid_action),
+        ("下注轮继续与结束", test_round_continue_and_over),
+        ("弃牌只剩一名玩家", test_fold_to_one_player),
+    ]
+
+    results = []
+    for name, test in tests:
+        try:
+            results.append((name, test()))
+        except Exception as e:
+            print(f"{name} 异常: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    print("\n" + "=" * 50)
+    print("测试结果汇总")
+    print("=" * 50)
+
+    for name, passed in results:
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"{name}: {status}")
+
+    all_passed = all(passed for _, passed in results)
+    print("\n" + ("所有测试通过！" if all_passed else "有测试失败！"))
+    sys.exit(0 if all_passed else 1)
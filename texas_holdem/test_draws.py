@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+听牌识别测试
+验证 DrawEvaluator.identify_draws（位掩码实现）对顺子与同花听牌的分类
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from texas_holdem.core.card import Card
+from texas_holdem.ai.shark_ai import DrawEvaluator
+
+
+def _draws(hole, board):
+    """用 (花色, 牌面) 列表识别听牌"""
+    return DrawEvaluator.identify_draws([Card(*c) for c in hole], [Card(*c) for c in board])
+
+
+def _straight_draw(draws):
+    """返回顺子听牌类型：'oesd'、'gutshot' 或 None（两者都有时以两端顺为准）"""
+    if 'oesd' in draws:
+        return 'oesd'
+    if 'gutshot' in draws:
+        return 'gutshot'
+    return None
+
+
+def test_wheel_draws():
+    """测试：A-2-3-4 与 A-2-3-5 都只听一张5，是卡顺；2-3-4-5 听A或6，是两端顺"""
+    print("=" * 50)
+    print("测试: 轮子顺听牌")
+    print("=" * 50)
+
+    a234 = _straight_draw(_draws([('H', 'A'), ('D', '2')], [('C', '3'), ('S', '4'), ('H', '9')]))
+    a235 = _straight_draw(_draws([('H', 'A'), ('D', '2')], [('C', '3'), ('S', '5'), ('H', '9')]))
+    low = _straight_draw(_draws([('H', '2'), ('D', '3')], [('C', '4'), ('S', '5'), ('H', '9')]))
+
+    if a234 == 'gutshot' and a235 == 'gutshot' and low == 'oesd':
+        print("[PASS] A-2-3-4、A-2-3-5 为卡顺，2-3-4-5 为两端顺")
+        return True
+    print(f"[FAIL] A-2-3-4: {a234}, A-2-3-5: {a235}, 2-3-4-5: {low}")
+    return False
+
+
+def test_broadway_draws():
+    """测试：J-Q-K-A 只听一张10，是卡顺；10-J-Q-K 听9或A，是两端顺"""
+    print("=" * 50)
+    print("测试: 高端顺子听牌")
+    print("=" * 50)
+
+    jqka = _straight_draw(_draws([('H', 'A'), ('D', 'K')], [('C', 'Q'), ('S', 'J'), ('H', '3')]))
+    tjqk = _straight_draw(_draws([('H', 'K'), ('D', 'Q')], [('C', 'J'), ('S', '10'), ('H', '3')]))
+    middle = _straight_draw(_draws([('H', '8'), ('D', '9')], [('C', '10'), ('S', 'J'), ('H', '2')]))
+
+    if jqka == 'gutshot' and tjqk == 'oesd' and middle == 'oesd':
+        print("[PASS] J-Q-K-A 为卡顺，10-J-Q-K 与 8-9-10-J 为两端顺")
+        return True
+    print(f"[FAIL] J-Q-K-A: {jqka}, 10-J-Q-K: {tjqk}, 8-9-10-J: {middle}")
+    return False
+
+
+def test_flush_draws():
+    """测试：四张同花且有底牌参与才是同花听牌，与卡顺同时出现时为组合听牌"""
+    print("=" * 50)
+    print("测试: 同花听牌")
+    print("=" * 50)
+
+    flush = _draws([('H', 'A'), ('H', '2')], [('H', '9'), ('H', '4'), ('C', 'K')])
+    board_only = _draws([('C', 'A'), ('D', '2')], [('H', '9'), ('H', '4'), ('H', 'K'), ('H', '7')])
+    combo = _draws([('H', 'A'), ('H', '2')], [('H', '3'), ('H', '4'), ('C', 'K')])
+
+    ok = ('flush_draw' in flush
+          and 'flush_draw' not in board_only
+          and combo.get('combo_draw', {}).get('outs') == 12)
+    if ok:
+        print("[PASS] 同花听牌与组合听牌识别正确")
+        return True
+    print(f"[FAIL] 同花: {flush}, 公共牌四同花: {board_only}, 组合: {combo}")
+    return False
+
+
+if __name__ == "__main__":
+    tests = [
+        ("轮子顺听牌", test_wheel_draws),
+        ("高端顺子听牌", test_broadway_draws),
+        ("同花听牌", test_flush_draws),
+    ]
+
+    results = []
+    for name, test in tests:
+        try:
+            results.append((name, test()))
+        except Exception as e:
+            print(f"{name} 异常: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    print("\n" + "=" * 50)
+    print("测试结果汇总")
+    print("=" * 50)
+
+    for name, passed in results:
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"{name}: {status}")
+
+    all_passed = all(passed for _, passed in results)
+    print("\n" + ("所有测试通过！" if all_passed else "有测试失败！"))
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+存档管理器测试
+验证各种存档格式的读写往返以及不可信数据的处理
+"""
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from texas_holdem.core.card import Card
+from texas_holdem.core.hand import Hand
+from texas_holdem.utils.save_manager import (
+    SaveManager, GameStateEncoder, GameStateDecoder,
+    _load_save_bytes, _peek_save_time, _write_atomic,
+)
+
+
+def test_json_slot_rejects_pickle():
+    """测试：以 0x80 开头的 .json 存档不会被当作 pickle 反序列化"""
+    print("=" * 50)
+    print("测试: JSON 存档拒绝 pickle 数据")
+    print("=" * 50)
+
+    SaveManager.ensure_save_dir()
+    payload = pickle.dumps({'save_time': 'x', 'loaded': True}, protocol=pickle.HIGHEST_PROTOCOL)
+    with open(SaveManager._slot_path(2), 'wb') as f:
+        f.write(payload)
+
+    data = SaveManager.load_game(2)
+    SaveManager.delete_save(2)
+    if payload[:1] == b'\x80' and data is None:
+        print("[PASS] load_game 未反序列化 pickle 数据")
+        return True
+    print(f"[FAIL] load_game 返回: {data}")
+    return False
+
+
+def test_binary_save_roundtrip():
+    """测试：二进制存档只能通过 load_game_binary 加载"""
+    print("=" * 50)
+    print("测试: 二进制存档往返")
+    print("=" * 50)
+
+    save_time = SaveManager.save_game_binary({'chips': [1000, 980]}, 3)
+    data = SaveManager.load_game_binary(3)
+    ok = (save_time is not None
+          and data == {'save_time': save_time, 'chips': [1000, 980]}
+          and SaveManager.load_game(3) is None
+          and 3 not in SaveManager.list_saves())
+    os.remove(SaveManager._binary_slot_path(3))
+    if ok:
+        print("[PASS] 二进制存档读写正确，且不出现在 JSON 存档列表中")
+        return True
+    print(f"[FAIL] 读取结果: {data}")
+    return False
+
+
+def test_save_recreates_deleted_dir():
+    """测试：存档目录在运行期间被删除后，保存会重新创建目录"""
+    print("=" * 50)
+    print("测试: 存档目录被删除后重新创建")
+    print("=" * 50)
+
+    SaveManager.ensure_save_dir()
+    shutil.rmtree(SaveManager._get_save_dir())
+    save_time = SaveManager.save_game({'chips': [1000]}, 1)
+    SaveManager.delete_save(1)
+
+    shutil.rmtree(SaveManager._get_save_dir())
+    auto_ok = SaveManager.save_auto({'chips': [1000]})
+    data = SaveManager.load_auto()
+    SaveManager.delete_autosave()
+    if save_time is not None and auto_ok and data is not None:
+        print("[PASS] 存档与自动存档均重新创建目录后写入成功")
+        return True
+    print(f"[FAIL] 存档: {save_time}, 自动存档: {auto_ok}")
+    return False
+
+
+def test_save_dir_follows_cwd():
+    """测试：切换工作目录后存档写入新目录下的 saves"""
+    print("=" * 50)
+    print("测试: 存档目录随工作目录变化")
+    print("=" * 50)
+
+    old_cwd = os.getcwd()
+    SaveManager.ensure_save_dir()
+    os.chdir(tempfile.mkdtemp())
+    try:
+        save_time = SaveManager.save_game({'chips': [1000]}, 1)
+        ok = (save_time is not None
+              and os.path.exists(os.path.join(os.getcwd(), 'saves', 'save_1.json'))
+              and not os.path.exists(os.path.join(old_cwd, 'saves', 'save_1.json')))
+        SaveManager.delete_save(1)
+    finally:
+        os.chdir(old_cwd)
+    if ok:
+        print("[PASS] 存档写入当前工作目录")
+        return True
+    print("[FAIL] 存档未写入当前工作目录")
+    return False
+
+
+def test_compressed_save_roundtrip():
+    """测试：zlib 压缩存档往返，读取时按文件头自动识别格式"""
+    print("=" * 50)
+    print("测试: 压缩存档往返")
+    print("=" * 50)
+
+    data = {'chips': [1000, 980], 'hand': [12, 25]}
+    save_time = SaveManager.save_game(dict(data), 1, compress=True)
+    with open(SaveManager._slot_path(1), 'rb') as f:
+        raw = f.read()
+    loaded = SaveManager.load_game(1)
+    SaveManager._info_cache.clear()
+    info = SaveManager.get_save_info(1)
+    SaveManager.delete_save(1)
+
+    plain = b'{"chips":[1]}'
+    ok = (raw[:1] == b'\x78'
+          and loaded == {'save_time': save_time, **data}
+          and info == save_time
+          and _load_save_bytes(plain) == {'chips': [1]}
+          and _load_save_bytes(zlib.compress(plain)) == {'chips': [1]})
+    if ok:
+        print("[PASS] 压缩存档读写正确，JSON 与 zlib 数据均能识别")
+        return True
+    print(f"[FAIL] 读取结果: {loaded}, 存档信息: {info}")
+    return False
+
+
+def test_atomic_write_cleanup():
+    """测试：原子写入成功后不留临时文件，写入失败时原文件保持不变"""
+    print("=" * 50)
+    print("测试: 原子写入与临时文件清理")
+    print("=" * 50)
+
+    SaveManager.ensure_save_dir()
+    filepath = SaveManager._slot_path(3)
+    _write_atomic(filepath, b'old')
+    written = not os.path.exists(filepath + '.tmp')
+
+    try:
+        _write_atomic(filepath, 'not bytes')  # 写入时抛出 TypeError
+        raised = False
+    except TypeError:
+        raised = True
+    with open(filepath, 'rb') as f:
+        content = f.read()
+    cleaned = not os.path.exists(filepath + '.tmp')
+    os.remove(filepath)
+
+    if written and raised and content == b'old' and cleaned:
+        print("[PASS] 临时文件已清理，原文件未被破坏")
+        return True
+    print(f"[FAIL] 写入后无临时文件: {written}, 抛出异常: {raised}, "
+          f"原文件内容: {content}, 失败后无临时文件: {cleaned}")
+    return False
+
+
+def test_peek_save_time():
+    """测试：紧凑与缩进格式的存档都能只读开头获取保存时间，旧格式返回 None"""
+    print("=" * 50)
+    print("测试: 读取存档开头的保存时间")
+    print("=" * 50)
+
+    compact_time = SaveManager.save_game({'chips': [1000]}, 1)
+    pretty_time = SaveManager.save_game({'chips': [1000]}, 2, pretty=True)
+    compact = _peek_save_time(SaveManager._slot_path(1))
+    pretty = _peek_save_time(SaveManager._slot_path(2))
+
+    # 旧格式存档：save_time 不是第一个键
+    with open(SaveManager._slot_path(3), 'wb') as f:
+        f.write(b'{"chips": [1000], "save_time": "2024-01-01 00:00:00"}')
+    legacy = _peek_save_time(SaveManager._slot_path(3))
+    saves = SaveManager.list_saves()
+    for slot in (1, 2, 3):
+        SaveManager.delete_save(slot)
+
+    ok = (compact == compact_time and pretty == pretty_time and legacy is None
+          and saves == {1: compact_time, 2: pretty_time, 3: '2024-01-01 00:00:00'})
+    if ok:
+        print("[PASS] 保存时间读取正确，旧格式存档回退到完整解析")
+        return True
+    print(f"[FAIL] 紧凑: {compact}, 缩进: {pretty}, 旧格式: {legacy}, 存档列表: {saves}")
+    return False
+
+
+def test_decode_card_formats():
+    """测试：扑克牌编码为整数编号，解码兼容旧存档的字典格式"""
+    print("=" * 50)
+    print("测试: 扑克牌编码与旧格式兼容")
+    print("=" * 50)
+
+    cards = [Card(suit, rank) for suit in Card.SUIT_BY_INDEX for rank in Card.RANKS]
+    ids = [GameStateEncoder.encode_card(card) for card in cards]
+    decoded = [GameStateDecoder.decode_card(card_id) for card_id in ids]
+    legacy = [GameStateDecoder.decode_card({'suit': card.suit, 'rank': card.rank})
+              for card in cards]
+
+    hand = Hand()
+    hand.add_card(Card('S', 'A'))
+    hand.add_card(Card('H', '10'))
+    encoded_hand = GameStateEncoder.encode_hand(hand)
+    mixed = GameStateDecoder.decode_hand([encoded_hand[0], {'suit': 'H', 'rank': '10'}])
+
+    ok = (sorted(ids) == list(range(52))
+          and all(isinstance(card_id, int) for card_id in ids)
+          and decoded == cards and legacy == cards
+          and GameStateEncoder.encode_card(None) is None
+          and GameStateDecoder.decode_card(None) is None
+          and encoded_hand == [51, 8]
+          and mixed.get_cards() == hand.get_cards())
+    if ok:
+        print("[PASS] 52张牌编号唯一，整数与字典格式解码一致")
+        return True
+    print(f"[FAIL] 编号: {ids}, 手牌编码: {encoded_hand}")
+    return False
+
+
+if __name__ == "__main__":
+    # 存档写入临时目录，不影响真实存档
+    os.chdir(tempfile.mkdtemp())
+
+    tests = [
+        ("JSON 存档拒绝 pickle 数据", test_json_slot_rejects_pickle),
+        ("二进制存档往返", test_binary_save_roundtrip),
+        ("存档目录被删除后重新创建", test_save_recreates_deleted_dir),
+        ("存档目录随工作目录变化", test_save_dir_follows_cwd),
+        ("压缩存档往返", test_compressed_save_roundtrip),
+        ("原子写入与临时文件清理", test_atomic_write_cleanup),
+        ("读取存档开头的保存时间", test_peek_save_time),
+        ("扑克牌编码与旧格式兼容", test_decode_card_formats),
+    ]
+
+    results = []
+    for name, test in tests:
+        try:
+            results.append((name, test()))
+        except Exception as e:
+            print(f"{name} 异常: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append((name, False))
+
+    print("\n" + "=" * 50)
+    print("测试结果汇总")
+    print("=" * 50)
+
+    for name, passed in results:
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"{name}: {status}")
+
+    all_passed = all(passed for _, passed in results)
+    print("\n" + ("所有测试通过！" if all_passed else "有测试失败！"))
+    sys.exit(0 if all_passed else 1)
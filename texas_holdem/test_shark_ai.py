@@ -19,8 +19,10 @@ from texas_holdem.core.player import Player
 from texas_holdem.core.table import Table
 from texas_holdem.game.game_state import GameState
 from texas_holdem.game.game_engine import GameEngine
+from texas_holdem.game.betting import RoundStatus
 from texas_holdem.ai.ai_engine import AIEngine
 from texas_holdem.ai.shark_ai import SharkAI
+from texas_holdem.utils.constants import Action
 
 
 @dataclass
@@ -215,6 +217,9 @@ class AutoGameTester:
         self.engine = None
         self.ai_engine = AIEngine()
         self.shark_ai = None
+        self._shark = None  # 鲨鱼玩家（setup_game 时确定）
+        # 本手牌的手牌强度缓存：(玩家, 公共牌张数) -> 强度，每手牌开始时清空
+        self._hs_cache = {}
         self.analyzer = SharkAIAnalyzer()
         
         self.results = {
@@ -265,16 +270,16 @@ class AutoGameTester:
         self.shark_ai = SharkAI()
         self.shark_ai.initialize_opponents(self.engine.players)
         
-        shark = self._get_shark_player()
+        # 缓存鲨鱼玩家，后续按身份比较
+        self._shark = next((p for p in self.engine.game_state.players
+                            if p.ai_style == 'SHARK'), None)
+        shark = self._shark
         if shark:
             self.results['shark_chips_start'] = shark.chips
     
     def _get_shark_player(self) -> Optional[Player]:
         """获取鲨鱼AI玩家"""
-        for player in self.engine.game_state.players:
-            if getattr(player, 'ai_style', '') == 'SHARK':
-                return player
-        return None
+        return self._shark
     
     def _get_position_name(self, player: Player) -> str:
         """获取位置名称"""
@@ -327,13 +332,13 @@ class AutoGameTester:
     def _get_opponent_aggression(self) -> str:
         """评估对手激进程度"""
         gs = self.engine.game_state
-        active = [p for p in gs.players if p.is_active and getattr(p, 'ai_style', '') != 'SHARK']
+        active = [p for p in gs.players if p.is_active and p.ai_style != 'SHARK']
         
         if not active:
             return "低"
         
         # 根据对手风格判断
-        aggressive_count = sum(1 for p in active if getattr(p, 'ai_style', '') in ['LAG', 'TAG'])
+        aggressive_count = sum(1 for p in active if p.ai_style in ['LAG', 'TAG'])
         ratio = aggressive_count / len(active)
         
         if ratio > 0.6:
@@ -344,7 +349,7 @@ class AutoGameTester:
     
     def _record_loss_if_any(self, hand_num: int, street: str):
         """记录输牌（如果有损失）"""
-        shark = self._get_shark_player()
+        shark = self._shark
         if not shark:
             return
         
@@ -364,7 +369,7 @@ class AutoGameTester:
             hand_strength = self.ai_engine.evaluate_hand_strength(hole_cards, community)
             
             # 获取活跃对手数
-            active_opps = len([p for p in gs.players if p.is_active and p != shark])
+            active_opps = len([p for p in gs.players if p.is_active and p is not shark])
             
             record = LossHandRecord(
                 hand_number=hand_num,
@@ -408,7 +413,12 @@ class AutoGameTester:
         hole_cards = player.hand.cards if player.hand else []
         community_cards = game_state.table.community_cards
         
-        hand_strength = self.ai_engine.evaluate_hand_strength(hole_cards, community_cards)
+        # 同一街内底牌和公共牌都不变，每名玩家只评估一次
+        key = (player, len(community_cards))
+        hand_strength = self._hs_cache.get(key)
+        if hand_strength is None:
+            hand_strength = self.ai_engine.evaluate_hand_strength(hole_cards, community_cards)
+            self._hs_cache[key] = hand_strength
         win_prob = hand_strength
         
         total_pot = game_state.table.total_pot if hasattr(game_state.table, 'total_pot') else 0
@@ -433,7 +443,7 @@ class AutoGameTester:
     
     def _track_action(self, player: Player, action: str, amount: int, success: bool = True):
         """追踪行动"""
-        if player.ai_style != 'SHARK':
+        if player is not self._shark:
             return
         
         if not success:
@@ -446,15 +456,15 @@ class AutoGameTester:
         self._current_hand_info['last_amount'] = amount
         
         # VPIP/PFR统计
-        if game_state.state == GameState.PRE_FLOP and action not in ['fold'] and not self._hand_vpip_recorded:
+        if game_state.state == GameState.PRE_FLOP and action != Action.FOLD and not self._hand_vpip_recorded:
             self.results['vpip_count'] += 1
             self._hand_vpip_recorded = True
         
-        if game_state.state == GameState.PRE_FLOP and action in ['raise', 'bet'] and not self._hand_pfr_recorded:
+        if game_state.state == GameState.PRE_FLOP and action in (Action.RAISE, Action.BET) and not self._hand_pfr_recorded:
             self.results['pfr_count'] += 1
             self._hand_pfr_recorded = True
         
-        if action == 'fold':
+        if action == Action.FOLD:
             self.results['folds'] += 1
     
     def _process_betting_round(self, hand_num: int, street: str) -> bool:
@@ -464,8 +474,10 @@ class AutoGameTester:
         
         max_actions = 100
         action_count = 0
+        # 下注轮是否结束：开局检查一次，之后由 process_action 返回的状态更新
+        round_over = game_state.is_betting_round_complete()
         
-        while not game_state.is_betting_round_complete() and action_count < max_actions:
+        while not round_over and action_count < max_actions:
             current_player = game_state.get_current_player()
             if not current_player or not current_player.is_active:
                 game_state.next_player()
@@ -478,29 +490,30 @@ class AutoGameTester:
                 action_count += 1
                 continue
             
-            action_str = action.name.lower() if hasattr(action, 'name') else str(action).lower()
-            
             # 更新鲨鱼AI的对手追踪
-            if self.shark_ai and getattr(current_player, 'ai_style', '') != 'SHARK':
+            if self.shark_ai and current_player.ai_style != 'SHARK':
                 street_name = game_state.state.name.lower() if hasattr(game_state.state, 'name') else str(game_state.state).lower()
-                self.shark_ai.update_after_action(current_player.name, action_str, street_name)
+                self.shark_ai.update_after_action(current_player.idx, action, street_name)
             
             # 执行行动
-            success, message, bet_amount = betting_round.process_action(current_player, action, amount)
+            status, message, bet_amount = betting_round.process_action(current_player, action, amount)
             action_count += 1
-            if not success:
+            if status is RoundStatus.INVALID:
                 if current_player.is_active:
                     current_player.fold()
                     game_state.update_active_players()
+                    # 强制弃牌改变了局面，需重新判断下注轮是否结束
+                    round_over = game_state.is_betting_round_complete()
                 game_state.next_player()
                 continue
             
             # 记录行动
-            self._track_action(current_player, action_str, amount)
+            self._track_action(current_player, action, amount)
             
             # 检查是否只剩一个玩家
-            if len([p for p in game_state.players if p.is_active]) <= 1:
+            if status is RoundStatus.HAND_OVER:
                 return False
+            round_over = status is RoundStatus.ROUND_OVER
         
         # 记录本街的输牌
         self._record_loss_if_any(hand_num, street)
@@ -513,7 +526,7 @@ class AutoGameTester:
         """运行一手牌"""
         try:
             # 检查鲨鱼是否被淘汰
-            shark = self._get_shark_player()
+            shark = self._shark
             if not shark or shark.chips <= 0:
                 self.results['eliminated'] = True
                 if self.results['eliminated_at_hand'] == 0:
@@ -527,36 +540,38 @@ class AutoGameTester:
             
             # 开始新一手
             self.engine.start_new_hand()
+            self._hs_cache.clear()
             self.results['hands_played'] += 1
             
-            # 翻牌前
+            # 翻牌前（弃牌与 advance_stage 都会同步活动玩家列表，街间直接取其长度）
+            game_state = self.engine.game_state
             if not self._process_betting_round(hand_num, 'preflop'):
                 return True
             
-            if len([p for p in self.engine.game_state.players if p.is_active]) <= 1:
+            if game_state.get_active_player_count() <= 1:
                 return True
             
             # 发翻牌
             self.engine.deal_flop()
-            self.engine.game_state.advance_stage()
+            game_state.advance_stage()
             if not self._process_betting_round(hand_num, 'flop'):
                 return True
             
-            if len([p for p in self.engine.game_state.players if p.is_active]) <= 1:
+            if game_state.get_active_player_count() <= 1:
                 return True
             
             # 发转牌
             self.engine.deal_turn()
-            self.engine.game_state.advance_stage()
+            game_state.advance_stage()
             if not self._process_betting_round(hand_num, 'turn'):
                 return True
             
-            if len([p for p in self.engine.game_state.players if p.is_active]) <= 1:
+            if game_state.get_active_player_count() <= 1:
                 return True
             
             # 发河牌
             self.engine.deal_river()
-            self.engine.game_state.advance_stage()
+            game_state.advance_stage()
             if not self._process_betting_round(hand_num, 'river'):
                 return True
             
@@ -579,7 +594,7 @@ class AutoGameTester:
             if not self.run_hand(hand_num):
                 if self.results['eliminated']:
                     # 记录淘汰信息
-                    shark = self._get_shark_player()
+                    shark = self._shark
                     final_chips = shark.chips if shark else 0
                     self.analyzer.record_elimination(hand_num - 1, final_chips, hand_num - 1)
                     break
@@ -589,7 +604,7 @@ class AutoGameTester:
     
     def _calculate_final_results(self):
         """计算最终结果"""
-        shark = self._get_shark_player()
+        shark = self._shark
         if shark:
             self.results['shark_chips_end'] = shark.chips
             self.results['shark_profit'] = shark.chips - self.results['shark_chips_start']
@@ -1782,7 +1782,7 @@ class CLI:
                 )
             }
             
-            return SaveManager.save_game(save_data, slot)
+            return SaveManager.save_game(save_data, slot) is not None
         except Exception as e:
             print(f"保存失败: {e}")
             return False
@@ -1799,10 +1799,10 @@ class CLI:
     
     def autosave_game(self) -> bool:
         """
-        自动保存当前游戏状态（单存档模式）
+        自动保存当前游戏状态（单存档模式，后台写入文件）
         
         Returns:
-            是否保存成功
+            是否已提交保存
         """
         if not self.game_engine:
             return False
@@ -1824,7 +1824,8 @@ class CLI:
                 )
             }
             
-            return SaveManager.save_auto(save_data)
+            # 文件写入在后台进行，不阻塞游戏循环
+            return SaveManager.save_auto_async(save_data)
         except Exception as e:
             print(f"自动保存失败: {e}")
             return False
@@ -2223,7 +2224,7 @@ class CLI:
         )
         
         # 鲨鱼AI使用自己的决策逻辑
-        style = getattr(player, 'ai_style', 'LAG')
+        style = player.ai_style or 'LAG'
         if style == 'SHARK':
             return self.shark_ai.get_action(
                 player, betting_round, hand_strength,
@@ -2830,7 +2831,7 @@ class CLI:
         import random
 
         # 获取玩家风格配置
-        style = getattr(player, 'ai_style', 'LAG')
+        style = player.ai_style or 'LAG'
         
         # 鲨鱼AI使用动态调整后的配置
         if style == 'SHARK':